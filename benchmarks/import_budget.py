@@ -0,0 +1,74 @@
+"""
+Cold-start budget check for the Dash entry point.
+
+Times `import main` + `create_app()` in fresh interpreters and fails if the
+best run exceeds the budget, or if the heavy simulation stack was imported
+eagerly.
+
+    python benchmarks/import_budget.py [--budget SECONDS] [--repeats N]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# seconds for import main + create_app(); override with CASCADESIM_IMPORT_BUDGET
+IMPORT_BUDGET_SECONDS = float(os.environ.get("CASCADESIM_IMPORT_BUDGET", 1.5))
+
+# must not be loaded until the first simulation request
+DEFERRED_MODULES = [
+    "networkx",
+    "scipy",
+    "builders.dashboard_builders",
+    "cascades.custom_cascades",
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+main.create_app(warm=False)
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (DEFERRED_MODULES,)
+
+
+def measure(repeats: int) -> dict:
+    runs = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return min(runs, key=lambda run: run["seconds"])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget", type=float, default=IMPORT_BUDGET_SECONDS)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    best = measure(args.repeats)
+    print(f"import main + create_app(): {best['seconds']:.3f}s (budget {args.budget:.3f}s)")
+
+    failed = False
+    if best["seconds"] > args.budget:
+        print("FAIL: cold start exceeds the import-time budget")
+        failed = True
+    if best["loaded"]:
+        print(f"FAIL: eagerly imported {', '.join(best['loaded'])}")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
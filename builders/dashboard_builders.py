@@ -1,84 +1,212 @@
-from typing import Tuple, Dict
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Tuple, Dict, Optional
 import numpy as np
 import networkx as nx
 import pandas as pd
 import plotly.graph_objects as go
+import scipy.sparse as sp
 
 from config import NetTopologyConfig, CascadeConfig
-from builders.graph_builders import build_graph
-from builders.metric_builders import graph_metrics
-from layout.compute import compute_layout
+from builders.graph_builders import build_graph, assign_node_weights, csr_degrees, degree_weights
+from builders.metric_builders import csr_metrics, graph_metrics
+from builders.evolution_builders import build_evolution, evolution_factory
+from layout.compute import compute_layout, extend_layout
 from layout.draw import (
     draw_node,
     draw_edge,
-    draw_active_edges,
-    update_colors_per_frame,
 )
+from builders.playback_builders import build_frames, cache_playback, evolution_traces, has_playback, is_evolving
+from builders.result_cache import cache_key, shared_cache
 from cascades.custom_cascades import run_custom_cascade
 from cascades.monte_carlo_cascades import cascade_size_monte_carlo
 from cascades.timeseries_cascades import cascade_timeseries
+from cascades.expected_cascades import run_expected_cascade, run_expected_cascade_csr
+from cascades.sweep_cascades import influence_sweep, influence_sweep_csr
+from cascades.seed_selection import rr_seeds_csr, select_seeds, top_degree_nodes
 
+# bump when the shape of a cached dashboard result changes, so stale shared
+# cache entries are not unpacked
+DASHBOARD_CACHE_VERSION = 6
 
-def build_dashboard(
-    net_topology_label: str,
+# seeding strategies every dashboard compares the selected one against
+BASELINE_SEEDINGS = ("random", "degree")
+
+# too slow to resolve for the instant preview, which falls back to random seeding
+PREVIEW_SKIPPED_SEEDINGS = ("celf",)
+
+# loaded edge lists can dwarf the generated graphs; above this many nodes they
+# stay in CSR (no networkx graph), the network view and the Monte Carlo panels
+# are not built, and only the mean-field model and the influence sweep run
+LARGE_GRAPH_NODES = int(os.environ.get("CASCADESIM_LARGE_GRAPH_NODES", 100_000))
+
+# seeding strategies that run on the CSR, the others fall back to degree
+LARGE_GRAPH_SEEDINGS = ("random", "degree", "rr")
+
+
+def with_seeding(graph: nx.Graph, cascade_config: CascadeConfig, seeding: str) -> CascadeConfig:
+    # resolve a seeding strategy into the concrete seed set run_custom_cascade uses
+    config = replace(cascade_config, seeding=seeding, seed_nodes=None)
+    seed_nodes = select_seeds(graph, config)
+    return config if seed_nodes is None else replace(config, seed_nodes=tuple(seed_nodes))
+
+
+def load_large_network(
     net_topology_config: NetTopologyConfig,
-    cascade_config: CascadeConfig,
-    runs: int,
-) -> Tuple[go.Figure, go.Figure, go.Figure, go.Figure, Dict[str, float]]:
+) -> Optional[Tuple[sp.csr_array, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Adjacency, degrees, activity and influence of an edge list above
+    LARGE_GRAPH_NODES, read straight from its CSR cache; None for anything
+    that goes through build_graph.
+    """
+    # a missing path is reported by build_graph
+    if net_topology_config.name != "EDGELIST" or not net_topology_config.edge_list_path:
+        return None
+    from builders.edgelist_builders import load_edge_list_csr
 
-    graph = build_graph(net_topology_config)
+    adjacency, _ = load_edge_list_csr(net_topology_config.edge_list_path, net_topology_config.directed)
+    if adjacency.shape[0] <= LARGE_GRAPH_NODES:
+        return None
 
-    degrees = dict(graph.degree())
-    max_degree = max(degrees.values()) if degrees else 1
+    degrees = csr_degrees(adjacency, net_topology_config.directed)
+    activity, influence = degree_weights(degrees)
+    return adjacency, degrees, activity, influence
 
-    for node in graph.nodes():
-        graph.nodes[node]["activity"] = 0.2 + 0.8 * (degrees[node] / max_degree)
-        graph.nodes[node]["influence"] = 0.02 + 0.08 * (degrees[node] / max_degree)
 
-    metrics = graph_metrics(graph)
+def with_large_seeding(
+    large_network: Tuple[sp.csr_array, np.ndarray, np.ndarray, np.ndarray], cascade_config: CascadeConfig
+) -> CascadeConfig:
+    # with_seeding on the CSR; seed_nodes are dense labels
+    adjacency, degrees, activity, influence = large_network
+    seeding = cascade_config.seeding if cascade_config.seeding in LARGE_GRAPH_SEEDINGS else "degree"
+    config = replace(cascade_config, seeding=seeding, seed_nodes=None)
+    if seeding == "random":
+        return config
 
-    loc = compute_layout(graph, seed=cascade_config.seed)
+    k = max(1, int(len(degrees) * cascade_config.fraction_infected))
+    if seeding == "rr":
+        seed_nodes = rr_seeds_csr(adjacency, activity, influence, config, k)
+    else:
+        seed_nodes = top_degree_nodes(degrees, k)
+    return replace(config, seed_nodes=tuple(seed_nodes))
+
+
+def topology_fingerprint(net_topology_config: NetTopologyConfig) -> Optional[str]:
+    # the config only names an edge list's path; its contents have to be part
+    # of the cache key too, or an edited file keeps serving stale results
+    if net_topology_config.name != "EDGELIST":
+        return None
+    from builders.edgelist_builders import edge_list_fingerprint
+    return edge_list_fingerprint(net_topology_config.edge_list_path, net_topology_config.directed)
 
-    iterations = run_custom_cascade(graph, cascade_config)
-    time_series = cascade_timeseries(iterations, graph.number_of_nodes())
-    sizes = cascade_size_monte_carlo(graph, cascade_config, runs=runs)
 
-    static_edges = draw_edge(graph, loc, max_edges=6000)
+def resolve_seeding(
+    graph: nx.Graph, net_topology_config: NetTopologyConfig, cascade_config: CascadeConfig
+) -> CascadeConfig:
+    # the cascade view and the analysis panels are built by separate callbacks;
+    # going through the shared cache resolves an expensive seed set only once
+    if cascade_config.seeding == "random":
+        return with_seeding(graph, cascade_config, "random")
 
-    active_edges_trace = go.Scatter(
-        x=[],
-        y=[],
-        mode="lines",
-        line=dict(color="#2563eb", width=2.2),
-        hoverinfo="none",
-        name="active_edges",
+    key = cache_key(
+        "seeding", DASHBOARD_CACHE_VERSION, net_topology_config, topology_fingerprint(net_topology_config), cascade_config
     )
+    return shared_cache().get_or_compute(key, lambda: with_seeding(graph, cascade_config, cascade_config.seeding))
 
-    nodes = draw_node(
-        graph,
-        loc,
-        colors=[0] * graph.number_of_nodes(),
+
+def too_large_figure(nodes: int) -> go.Figure:
+    # placeholder for panels that are not built above LARGE_GRAPH_NODES
+    fig = go.Figure()
+    fig.add_annotation(
+        text=f"Skipped for {nodes:,} nodes (limit {LARGE_GRAPH_NODES:,}, CASCADESIM_LARGE_GRAPH_NODES)",
+        x=0.5,
+        y=0.5,
+        xref="paper",
+        yref="paper",
+        showarrow=False,
     )
+    fig.update_xaxes(visible=False)
+    fig.update_yaxes(visible=False)
+    return fig
 
-    cascade_fig = go.Figure(data=[static_edges, active_edges_trace, nodes])
 
-    frames, _ = update_colors_per_frame(graph, iterations)
+def build_cascade_view(
+    net_topology_label: str,
+    net_topology_config: NetTopologyConfig,
+    cascade_config: CascadeConfig,
+    initial_frames: Optional[int] = None,
+) -> go.Figure:
+    """
+    The animated network view: one cascade on the laid-out graph. Built
+    apart from the analysis panels so the first frame does not wait for
+    Monte Carlo work.
 
-    cascade_fig.frames = [
-        go.Frame(
-            name=frame.name,
-            data=[
-                draw_active_edges(
-                    iterations[int(frame.name)]["active_edges"],
-                    loc,
-                ),
-                go.Scatter(marker=frame.data[0].marker),
-            ],
-            traces=[1, 2],
-            layout=frame.layout,
+    With initial_frames set, the figure only carries the first
+    initial_frames frames; the full history is cached server side and its
+    token / frame counts are stored in cascade_fig.layout.meta so the
+    remaining frames can be paged in with playback_chunk.
+    """
+    large_network = load_large_network(net_topology_config)
+    if large_network is None:
+        graph = assign_node_weights(build_graph(net_topology_config))
+        n = graph.number_of_nodes()
+    else:
+        n = large_network[0].shape[0]
+
+    # nothing would show the cascade, so it is not run
+    if n > LARGE_GRAPH_NODES:
+        cascade_fig = too_large_figure(n)
+        if initial_frames is not None:
+            cascade_fig.update_layout(meta={"playback_token": None, "total_frames": 0, "loaded_frames": 0})
+    else:
+        cascade_config = resolve_seeding(graph, net_topology_config, cascade_config)
+        loc = compute_layout(graph, seed=cascade_config.seed)
+
+        # temporal networks evolve a copy; the layout describes the initial
+        # graph, nodes born during the cascade are placed incrementally
+        cascade_graph = graph.copy() if net_topology_config.evolution != "static" else graph
+        evolve = build_evolution(cascade_graph, net_topology_config, seed=cascade_config.seed)
+
+        iterations = run_custom_cascade(cascade_graph, cascade_config, evolve=evolve)
+
+        if evolve is not None:
+            loc = extend_layout(cascade_graph, loc, seed=cascade_config.seed)
+
+        # the figure shows the initial graph; frames replay the edge events on top
+        static_edges = draw_edge(graph, loc, max_edges=6000)
+
+        active_edges_trace = go.Scatter(
+            x=[],
+            y=[],
+            mode="lines",
+            line=dict(color="#2563eb", width=2.2),
+            hoverinfo="none",
+            name="active_edges",
+        )
+
+        nodes = draw_node(
+            graph,
+            loc,
+            colors=[0] * graph.number_of_nodes(),
         )
-        for frame in frames
-    ]
+
+        cascade_fig = go.Figure(data=[static_edges, active_edges_trace, nodes])
+        if is_evolving(iterations):
+            cascade_fig.add_traces(evolution_traces())
+
+        if initial_frames is None:
+            cascade_fig.frames = build_frames(graph, loc, iterations)
+        else:
+            loaded_frames = min(initial_frames, len(iterations))
+            cascade_fig.frames = build_frames(graph, loc, iterations, stop=loaded_frames)
+            cascade_fig.update_layout(
+                meta={
+                    "playback_token": cache_playback(graph, loc, iterations),
+                    "total_frames": len(iterations),
+                    "loaded_frames": loaded_frames,
+                }
+            )
 
     cascade_fig.update_layout(
         height=800,
@@ -124,25 +252,92 @@ def build_dashboard(
     cascade_fig.update_xaxes(showgrid=False, zeroline=False, showticklabels=False)
     cascade_fig.update_yaxes(showgrid=False, zeroline=False, showticklabels=False)
 
+    return cascade_fig
+
+
+def build_analysis(
+    net_topology_label: str,
+    net_topology_config: NetTopologyConfig,
+    cascade_config: CascadeConfig,
+    runs: int,
+) -> Tuple[go.Figure, go.Figure, go.Figure, go.Figure, go.Figure, Dict[str, float]]:
+    # dynamics, degree, Monte Carlo, sweep and seeding figures plus the metrics table
+    large_network = load_large_network(net_topology_config)
+
+    if large_network is None:
+        graph = assign_node_weights(build_graph(net_topology_config))
+        n = graph.number_of_nodes()
+
+        metrics = graph_metrics(graph)
+        cascade_config = resolve_seeding(graph, net_topology_config, cascade_config)
+
+        # same run as the cascade view (same seed), for its time series
+        cascade_graph = graph.copy() if net_topology_config.evolution != "static" else graph
+        evolve = build_evolution(cascade_graph, net_topology_config, seed=cascade_config.seed)
+
+        iterations = run_custom_cascade(cascade_graph, cascade_config, evolve=evolve)
+        time_series = cascade_timeseries(iterations, n)
+        expected_series = run_expected_cascade(graph, cascade_config)
+        sizes = cascade_size_monte_carlo(
+            graph, cascade_config, runs=runs, evolution=evolution_factory(net_topology_config)
+        )
+        sweep = influence_sweep(graph, cascade_config)
+
+        seeding_sizes = {cascade_config.seeding: sizes}
+        for seeding in BASELINE_SEEDINGS:
+            if seeding not in seeding_sizes:
+                seeding_sizes[seeding] = cascade_size_monte_carlo(
+                    graph,
+                    with_seeding(graph, cascade_config, seeding),
+                    runs=runs,
+                    evolution=evolution_factory(net_topology_config),
+                )
+
+        deg_vals = np.array([d for _, d in graph.degree()], dtype=float)
+        operating_point = max((influence for _, influence in graph.nodes(data="influence", default=0.0)), default=0.0)
+    else:
+        # CSR only: no networkx graph and no per-node simulation, the
+        # mean-field model and the sweep are vectorised over the edges
+        adjacency, deg_vals, activity, influence = large_network
+        n = adjacency.shape[0]
+
+        metrics = csr_metrics(adjacency, net_topology_config.directed)
+        cascade_config = with_large_seeding(large_network, cascade_config)
+
+        time_series, sizes, seeding_sizes = None, None, None
+        expected_series = run_expected_cascade_csr(adjacency, activity, influence, cascade_config)
+        sweep = influence_sweep_csr(adjacency, activity, influence, cascade_config)
+        operating_point = float(influence.max())
+
     dynamics_fig = go.Figure()
-    dynamics_fig.add_trace(
-        go.Scatter(
-            x=time_series["iteration_number"],
-            y=time_series["mean_responses"],
-            mode="lines",
-            name="Mean responses",
+    if time_series is not None:
+        dynamics_fig.add_trace(
+            go.Scatter(
+                x=time_series["iteration_number"],
+                y=time_series["mean_responses"],
+                mode="lines",
+                name="Mean responses",
+            )
+        )
+        dynamics_fig.add_trace(
+            go.Scatter(
+                x=time_series["iteration_number"],
+                y=time_series["max_responses"],
+                mode="lines",
+                name="Max responses (hub)",
+            )
         )
-    )
     dynamics_fig.add_trace(
         go.Scatter(
-            x=time_series["iteration_number"],
-            y=time_series["max_responses"],
+            x=expected_series["iteration_number"],
+            y=expected_series["mean_responses"],
             mode="lines",
-            name="Max responses (hub)",
+            line=dict(dash="dash"),
+            name="Expected mean responses (mean-field)",
         )
     )
     dynamics_fig.update_layout(
-        title="Broadcaster → Responder Dynamics",
+        title="Broadcaster → Responder Dynamics" if time_series is not None else "Broadcaster → Responder Dynamics (mean-field only)",
         height=360,
         paper_bgcolor="white",
         plot_bgcolor="white",
@@ -151,7 +346,6 @@ def build_dashboard(
     dynamics_fig.update_xaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
     dynamics_fig.update_yaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
 
-    deg_vals = np.array([d for _, d in graph.degree()], dtype=float)
     degree_counts = pd.Series(deg_vals).value_counts().sort_index()
 
     degree_fig = go.Figure()
@@ -174,13 +368,16 @@ def build_dashboard(
     degree_fig.update_xaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
     degree_fig.update_yaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
 
-    mc_fig = go.Figure()
-    mc_fig.add_trace(
-        go.Histogram(
-            x=sizes / graph.number_of_nodes(),
-            nbinsx=20,
+    if sizes is not None:
+        mc_fig = go.Figure()
+        mc_fig.add_trace(
+            go.Histogram(
+                x=sizes / n,
+                nbinsx=20,
+            )
         )
-    )
+    else:
+        mc_fig = too_large_figure(n)
     mc_fig.update_layout(
         title="Cascade Size Distribution (Monte Carlo)",
         height=360,
@@ -191,4 +388,290 @@ def build_dashboard(
     mc_fig.update_xaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
     mc_fig.update_yaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
 
-    return cascade_fig, dynamics_fig, degree_fig, mc_fig, metrics
\ No newline at end of file
+    sweep_fig = go.Figure()
+    sweep_fig.add_trace(
+        go.Scatter(
+            x=sweep["influence_probability"],
+            y=sweep["cascade_size"],
+            error_y=dict(type="data", array=sweep["cascade_size_std"], visible=True, thickness=0.8),
+            mode="lines+markers",
+        )
+    )
+    # the sweep scales influence so p is the strongest hub's influence;
+    # the simulated model therefore sits at the largest node influence
+    if operating_point > 0:
+        sweep_fig.add_vline(
+            x=operating_point,
+            line=dict(dash="dot", color="#2563eb"),
+        )
+    sweep_fig.update_layout(
+        title="Cascade Size vs Influence Probability (coupled sweep)",
+        xaxis_type="log",
+        height=360,
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        showlegend=False,
+    )
+    sweep_fig.update_xaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
+    sweep_fig.update_yaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
+
+    if seeding_sizes is not None:
+        seeding_fig = go.Figure()
+        seeding_fig.add_trace(
+            go.Bar(
+                x=list(seeding_sizes),
+                y=[seeding_size.mean() / n for seeding_size in seeding_sizes.values()],
+                error_y=dict(
+                    type="data",
+                    array=[seeding_size.std() / n for seeding_size in seeding_sizes.values()],
+                    visible=True,
+                ),
+                marker_color=[
+                    "#2563eb" if seeding == cascade_config.seeding else "#9ca3af" for seeding in seeding_sizes
+                ],
+            )
+        )
+    else:
+        seeding_fig = too_large_figure(n)
+    seeding_fig.update_layout(
+        title="Cascade Size by Seeding Strategy (Monte Carlo)",
+        height=360,
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        showlegend=False,
+    )
+    seeding_fig.update_xaxes(showgrid=False)
+    seeding_fig.update_yaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
+
+    return dynamics_fig, degree_fig, mc_fig, sweep_fig, seeding_fig, metrics
+
+
+def build_dashboard(
+    net_topology_label: str,
+    net_topology_config: NetTopologyConfig,
+    cascade_config: CascadeConfig,
+    runs: int,
+    initial_frames: Optional[int] = None,
+) -> Tuple[go.Figure, go.Figure, go.Figure, go.Figure, go.Figure, go.Figure, Dict[str, float]]:
+    # cascade view and analysis panels in one call, for scripts
+    cascade_fig = build_cascade_view(net_topology_label, net_topology_config, cascade_config, initial_frames)
+    return (cascade_fig, *build_analysis(net_topology_label, net_topology_config, cascade_config, runs))
+
+
+def cached_build_cascade_view(
+    net_topology_label: str,
+    net_topology_config: NetTopologyConfig,
+    cascade_config: CascadeConfig,
+    initial_frames: Optional[int] = None,
+) -> go.Figure:
+    """
+    build_cascade_view through the shared cross-worker cache. Identical
+    concurrent requests are coalesced into a single computation.
+    """
+    key = cache_key(
+        "cascade-view",
+        DASHBOARD_CACHE_VERSION,
+        net_topology_label,
+        net_topology_config,
+        topology_fingerprint(net_topology_config),
+        cascade_config,
+        initial_frames,
+    )
+
+    def compute():
+        return build_cascade_view(net_topology_label, net_topology_config, cascade_config, initial_frames)
+
+    cascade_fig = shared_cache().get_or_compute(key, compute)
+
+    # a paged figure is useless once its playback history has been evicted
+    meta = cascade_fig.layout.meta
+    if meta and meta["playback_token"] and not has_playback(meta["playback_token"]):
+        shared_cache().delete(key)
+        cascade_fig = shared_cache().get_or_compute(key, compute)
+
+    return cascade_fig
+
+
+def cached_build_analysis(
+    net_topology_label: str,
+    net_topology_config: NetTopologyConfig,
+    cascade_config: CascadeConfig,
+    runs: int,
+) -> Tuple[go.Figure, go.Figure, go.Figure, go.Figure, go.Figure, Dict[str, float]]:
+    # build_analysis through the shared cache, see cached_build_cascade_view
+    key = cache_key(
+        "analysis",
+        DASHBOARD_CACHE_VERSION,
+        net_topology_label,
+        net_topology_config,
+        topology_fingerprint(net_topology_config),
+        cascade_config,
+        runs,
+    )
+    return shared_cache().get_or_compute(
+        key, lambda: build_analysis(net_topology_label, net_topology_config, cascade_config, runs)
+    )
+
+
+def build_expected_preview(
+    net_topology_label: str,
+    net_topology_config: NetTopologyConfig,
+    cascade_config: CascadeConfig,
+) -> Tuple[go.Figure, float]:
+    """
+    Mean-field dynamics and expected (normalised) cascade size. Skips layout
+    and Monte Carlo, so it can be shown while build_analysis is running.
+    Degree and RR seeding are resolved as in build_dashboard; CELF needs
+    Monte Carlo runs per candidate, so the preview uses random seeding there.
+    Edge lists above LARGE_GRAPH_NODES run on their CSR (with_large_seeding).
+
+    The mean-field model runs on the initial graph only: growth and rewiring
+    are not modelled, and the title says so when evolution is selected.
+    """
+    large_network = load_large_network(net_topology_config)
+
+    if large_network is None:
+        graph = assign_node_weights(build_graph(net_topology_config))
+        n = graph.number_of_nodes()
+
+        seeding = cascade_config.seeding if cascade_config.seeding not in PREVIEW_SKIPPED_SEEDINGS else "random"
+        cascade_config = with_seeding(graph, cascade_config, seeding)
+        expected_series = run_expected_cascade(graph, cascade_config)
+    else:
+        adjacency, degrees, activity, influence = large_network
+        n = adjacency.shape[0]
+
+        cascade_config = with_large_seeding(large_network, cascade_config)
+        seeding = cascade_config.seeding
+        expected_series = run_expected_cascade_csr(adjacency, activity, influence, cascade_config)
+
+    expected_size = float(expected_series["total_responses"].sum()) / n if n else 0.0
+
+    expected_fig = go.Figure()
+    expected_fig.add_trace(
+        go.Scatter(
+            x=expected_series["iteration_number"],
+            y=expected_series["mean_responses"],
+            mode="lines",
+            name="Expected mean responses",
+        )
+    )
+    expected_fig.add_trace(
+        go.Scatter(
+            x=expected_series["iteration_number"],
+            y=expected_series["number_of_broadcasters"],
+            mode="lines",
+            line=dict(dash="dot"),
+            name="Expected broadcasters",
+        )
+    )
+    expected_fig.update_layout(
+        title=(
+            f"{net_topology_label} — Expected Dynamics (mean-field, {seeding} seeding"
+            + (", static network)" if net_topology_config.evolution != "static" else ")")
+        ),
+        height=360,
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        showlegend=False,
+    )
+    expected_fig.update_xaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
+    expected_fig.update_yaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
+
+    return expected_fig, expected_size
+
+
+def simulate_topology(
+    net_topology_config: NetTopologyConfig,
+    cascade_config: CascadeConfig,
+    runs: int,
+) -> Tuple[pd.DataFrame, np.ndarray, int]:
+    """
+    Build one topology and run a single cascade plus its Monte Carlo sizes.
+    Top-level so it can be shipped to a worker process.
+    """
+    graph = assign_node_weights(build_graph(net_topology_config))
+
+    cascade_graph = graph.copy() if net_topology_config.evolution != "static" else graph
+    evolve = build_evolution(cascade_graph, net_topology_config, seed=cascade_config.seed)
+
+    iterations = run_custom_cascade(cascade_graph, cascade_config, evolve=evolve)
+    time_series = cascade_timeseries(iterations, graph.number_of_nodes())
+    sizes = cascade_size_monte_carlo(
+        graph, cascade_config, runs=runs, evolution=evolution_factory(net_topology_config)
+    )
+
+    return time_series, sizes, graph.number_of_nodes()
+
+
+def build_comparison(
+    net_topology_configs: Dict[str, NetTopologyConfig],
+    cascade_config: CascadeConfig,
+    runs: int,
+    max_workers: Optional[int] = None,
+) -> Tuple[go.Figure, go.Figure]:
+    """
+    Simulate every topology concurrently and overlay their dynamics and
+    Monte Carlo size distributions.
+
+    All topologies share the same cascade config, so Monte Carlo run r uses
+    the same run seed everywhere, and run_custom_cascade keys its draws by
+    (run, tick, node) and (run, tick, node, neighbour): nodes and edges
+    shared by two topologies see the same uniforms. Generated topologies
+    share few edges, so this removes little of the sampling noise between
+    them; each histogram still needs its own number of runs.
+    """
+    if max_workers is None:
+        max_workers = min(len(net_topology_configs), os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {
+            label: pool.submit(simulate_topology, topology_config, cascade_config, runs)
+            for label, topology_config in net_topology_configs.items()
+        }
+        results = {label: future.result() for label, future in futures.items()}
+
+    dynamics_fig = go.Figure()
+    mc_fig = go.Figure()
+
+    for label, (time_series, sizes, n) in results.items():
+        dynamics_fig.add_trace(
+            go.Scatter(
+                x=time_series["iteration_number"],
+                y=time_series["mean_responses"],
+                mode="lines",
+                name=label,
+            )
+        )
+        normalised = sizes / n if n else sizes
+        mc_fig.add_trace(
+            go.Histogram(
+                x=normalised,
+                nbinsx=20,
+                opacity=0.55,
+                name=f"{label} (mean={normalised.mean():.3g})" if len(normalised) else label,
+            )
+        )
+
+    dynamics_fig.update_layout(
+        title="Mean Responses by Topology",
+        height=360,
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        showlegend=True,
+    )
+    dynamics_fig.update_xaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
+    dynamics_fig.update_yaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
+
+    mc_fig.update_layout(
+        title="Cascade Size Distribution by Topology (Monte Carlo)",
+        barmode="overlay",
+        height=360,
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        showlegend=True,
+    )
+    mc_fig.update_xaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
+    mc_fig.update_yaxes(showgrid=True, gridcolor="rgba(0,0,0,0.05)")
+
+    return dynamics_fig, mc_fig
@@ -0,0 +1,247 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from typing import Tuple
+import networkx as nx
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+# lines parsed per chunk; bounds parser memory independent of the file size
+EDGE_LIST_CHUNK_LINES = 2_000_000
+
+# converted graphs are cached here as memory-mappable .npy files
+EDGE_LIST_CACHE_DIR = os.environ.get(
+    "CASCADESIM_EDGE_LIST_CACHE",
+    os.path.join(tempfile.gettempdir(), "cascadesim_edgelists"),
+)
+
+# bump when the converted layout changes, so older cache directories are not reused
+EDGE_LIST_FORMAT_VERSION = 2
+
+# materialised networkx graphs kept per process, so a loaded edge list is
+# turned into a graph once rather than on every dashboard request
+EDGE_LIST_GRAPH_CACHE_SIZE = 2
+
+def edge_list_fingerprint(path: str, directed: bool) -> str:
+    # identity of the file's current contents (path, size, mtime); changes when it is edited
+    stat = os.stat(path)
+    fingerprint = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{directed}"
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+def _cache_dir(path: str, directed: bool) -> str:
+    # keyed on the file identity so an edited edge list is converted again
+    return os.path.join(EDGE_LIST_CACHE_DIR, f"{edge_list_fingerprint(path, directed)}-v{EDGE_LIST_FORMAT_VERSION}")
+
+def _relabel(
+        ids: np.ndarray, known_ids: np.ndarray, known_labels: np.ndarray, next_label: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    # known_ids is kept sorted so lookups are a searchsorted, not a dict
+    unique_ids = np.unique(ids)
+    new_ids = np.setdiff1d(unique_ids, known_ids, assume_unique=True)
+
+    if len(new_ids) > 0:
+        new_labels = np.arange(next_label, next_label + len(new_ids), dtype=np.int64)
+        next_label += len(new_ids)
+
+        merged_ids = np.concatenate([known_ids, new_ids])
+        merged_labels = np.concatenate([known_labels, new_labels])
+        order = np.argsort(merged_ids, kind="stable")
+        known_ids, known_labels = merged_ids[order], merged_labels[order]
+
+    return known_labels[np.searchsorted(known_ids, ids)], known_ids, known_labels, next_label
+
+def _convert(path: str, directed: bool, cache_dir: str, chunk_lines: int) -> None:
+    # built in a private directory and renamed into place, so concurrent
+    # conversions of the same file never see each other's partial output
+    os.makedirs(EDGE_LIST_CACHE_DIR, exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix=".converting-", dir=EDGE_LIST_CACHE_DIR)
+    try:
+        _convert_into(path, directed, work_dir, chunk_lines)
+
+        # left behind by an interrupted conversion that wrote in place
+        if os.path.isdir(cache_dir) and not os.path.exists(os.path.join(cache_dir, "complete")):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        try:
+            os.replace(work_dir, cache_dir)
+        except OSError:
+            # another process finished first and its directory is in place
+            if not os.path.exists(os.path.join(cache_dir, "complete")):
+                raise
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def _convert_into(path: str, directed: bool, cache_dir: str, chunk_lines: int) -> None:
+    edges_path = os.path.join(cache_dir, "edges.tmp")
+
+    known_ids = np.empty(0, dtype=np.int64)
+    known_labels = np.empty(0, dtype=np.int64)
+    next_label = 0
+    degrees = np.zeros(0, dtype=np.int64)
+    edge_count = 0
+
+    # pass 1: stream the text, relabel to dense ints, spill (src, dst) pairs to disk
+    reader = pd.read_csv(
+        path,
+        sep=r"\s+",
+        comment="#",
+        header=None,
+        usecols=[0, 1],
+        names=["source", "target"],
+        dtype=np.int64,
+        chunksize=chunk_lines,
+        compression="infer",
+    )
+    with open(edges_path, "wb") as spill:
+        for chunk in reader:
+            pairs = chunk.to_numpy()
+            pairs = pairs[pairs[:, 0] != pairs[:, 1]]  # no self loops
+            if len(pairs) == 0:
+                continue
+
+            labels, known_ids, known_labels, next_label = _relabel(
+                pairs.ravel(), known_ids, known_labels, next_label
+            )
+            labels = labels.reshape(-1, 2)
+            labels.tofile(spill)
+            edge_count += len(labels)
+
+            if len(degrees) < next_label:
+                degrees = np.concatenate([degrees, np.zeros(next_label - len(degrees), dtype=np.int64)])
+            degrees += np.bincount(labels[:, 0], minlength=len(degrees))
+            if not directed:
+                degrees += np.bincount(labels[:, 1], minlength=len(degrees))
+
+    n = next_label
+    degrees = np.concatenate([degrees, np.zeros(n - len(degrees), dtype=np.int64)])
+    indptr = np.concatenate([[0], np.cumsum(degrees)]).astype(np.int64)
+
+    # scipy wants indptr and indices in one dtype; matching them avoids a copy on load
+    index_dtype = np.int32 if max(n, int(indptr[-1])) < np.iinfo(np.int32).max else np.int64
+    indptr = indptr.astype(index_dtype)
+
+    # pass 2: scatter the spilled pairs straight into a memory-mapped indices array
+    raw_path = os.path.join(cache_dir, "indices.raw.npy")
+    indices = np.lib.format.open_memmap(raw_path, mode="w+", dtype=index_dtype, shape=(int(indptr[-1]),))
+    cursor = indptr[:-1].astype(np.int64)
+
+    if edge_count > 0:
+        spilled = np.memmap(edges_path, dtype=np.int64, mode="r", shape=(edge_count, 2))
+        directions = [(0, 1)] if directed else [(0, 1), (1, 0)]
+
+        for start in range(0, edge_count, chunk_lines):
+            block = np.asarray(spilled[start:start + chunk_lines])
+            for row, col in directions:
+                order = np.argsort(block[:, row], kind="stable")
+                sources, targets = block[order, row], block[order, col]
+
+                rows, first, counts = np.unique(sources, return_index=True, return_counts=True)
+                offsets = np.arange(len(sources)) - np.repeat(first, counts)
+                indices[cursor[sources] + offsets] = targets
+                cursor[rows] += counts
+        del spilled
+
+    os.remove(edges_path)
+
+    # pass 3: repeated lines and, for undirected graphs, reciprocal lines
+    # ("a b" and "b a") leave duplicate entries in a row
+    indptr, nnz = _dedupe_rows(indices, indptr, chunk_lines)
+    np.save(os.path.join(cache_dir, "indices.npy"), indices[:nnz])
+    del indices
+    os.remove(raw_path)
+
+    np.save(os.path.join(cache_dir, "indptr.npy"), indptr)
+
+    # original ids by dense label
+    node_ids = np.empty(n, dtype=np.int64)
+    node_ids[known_labels] = known_ids
+    np.save(os.path.join(cache_dir, "node_ids.npy"), node_ids)
+
+    # written last; the rename in _convert is what publishes the directory
+    with open(os.path.join(cache_dir, "complete"), "w") as marker:
+        marker.write(f"{n} {int(indptr[-1])}\n")
+
+def _dedupe_rows(indices: np.ndarray, indptr: np.ndarray, chunk_lines: int) -> Tuple[np.ndarray, int]:
+    """
+    Sort and deduplicate every CSR row in place, a block of about
+    chunk_lines entries at a time. Rows only shrink, so the compacted
+    output never overtakes the block being read. Returns the new indptr
+    and the number of entries kept.
+    """
+    n = len(indptr) - 1
+    bounds = indptr.astype(np.int64)
+    new_indptr = np.zeros(n + 1, dtype=np.int64)
+    written = 0
+
+    row = 0
+    while row < n:
+        stop = int(np.searchsorted(bounds, bounds[row] + chunk_lines, side="right")) - 1
+        stop = min(n, max(stop, row + 1))
+
+        block = np.array(indices[bounds[row]:bounds[stop]], dtype=np.int64)
+        rows = np.repeat(np.arange(row, stop, dtype=np.int64), np.diff(bounds[row:stop + 1]))
+
+        # (row, col) packed into one int64, unique also sorts each row
+        keys = np.unique(rows * n + block)
+        kept_rows = keys // n
+
+        indices[written:written + len(keys)] = keys - kept_rows * n
+        new_indptr[row + 1:stop + 1] = written + np.cumsum(np.bincount(kept_rows - row, minlength=stop - row))
+        written += len(keys)
+        row = stop
+
+    return new_indptr.astype(indptr.dtype), written
+
+def load_edge_list_csr(
+        path: str, directed: bool = False, chunk_lines: int = EDGE_LIST_CHUNK_LINES
+) -> Tuple[sp.csr_array, np.ndarray]:
+    """
+    Read a SNAP-style edge list (whitespace separated, '#' comments, plain
+    or compressed) into CSR with dense node labels. The first call streams
+    the file in chunks; later calls memory-map the cached binary arrays.
+
+    Returns the adjacency and the original node id for every dense label.
+    """
+    cache_dir = _cache_dir(path, directed)
+    if not os.path.exists(os.path.join(cache_dir, "complete")):
+        _convert(path, directed, cache_dir, chunk_lines)
+
+    indptr = np.load(os.path.join(cache_dir, "indptr.npy"), mmap_mode="r")
+    indices = np.load(os.path.join(cache_dir, "indices.npy"), mmap_mode="r")
+    node_ids = np.load(os.path.join(cache_dir, "node_ids.npy"), mmap_mode="r")
+
+    n = len(indptr) - 1
+    adjacency = sp.csr_array(
+        (np.ones(len(indices), dtype=np.int8), indices, indptr), shape=(n, n)
+    )
+    return adjacency, node_ids
+
+def edge_list_graph(path: str, directed: bool = False, chunk_lines: int = EDGE_LIST_CHUNK_LINES) -> nx.Graph:
+    """
+    The edge list as a networkx graph whose nodes are the dense labels
+    (load_edge_list_csr maps them back to file ids).
+
+    The graph is shared by every caller in the process: only node weights
+    may be written to it, anything that changes the topology must copy it.
+    """
+    # the cache directory name changes with the file, so edits are picked up
+    return _materialise(path, directed, chunk_lines, _cache_dir(path, directed))
+
+@lru_cache(maxsize=EDGE_LIST_GRAPH_CACHE_SIZE)
+def _materialise(path: str, directed: bool, chunk_lines: int, cache_dir: str) -> nx.Graph:
+    adjacency, _ = load_edge_list_csr(path, directed, chunk_lines)
+    n = adjacency.shape[0]
+
+    graph = nx.DiGraph() if directed else nx.Graph()
+    graph.add_nodes_from(range(n))
+
+    # add edges a block of rows at a time to keep the temporaries small
+    for start in range(0, n, 65536):
+        stop = min(n, start + 65536)
+        lo, hi = int(adjacency.indptr[start]), int(adjacency.indptr[stop])
+        sources = np.repeat(np.arange(start, stop), np.diff(adjacency.indptr[start:stop + 1]))
+        graph.add_edges_from(zip(sources.tolist(), np.asarray(adjacency.indices[lo:hi]).tolist()))
+
+    return graph
@@ -0,0 +1,113 @@
+import random
+from typing import Callable, List, Optional, Tuple
+import networkx as nx
+
+from config import NetTopologyConfig
+from builders.graph_builders import assign_node_weights
+
+Edge = Tuple[int, int]
+
+# called once per tick, mutates the graph in place and returns (added, removed) edges
+Evolution = Callable[[nx.Graph, int], Tuple[List[Edge], List[Edge]]]
+
+def build_evolution(graph: nx.Graph, ntconfig: NetTopologyConfig, seed: int) -> Optional[Evolution]:
+    """
+    Per-tick edge insertions / deletions for a temporal network. Updates are
+    applied to the graph's adjacency directly and touch only the affected
+    nodes, so an evolving tick costs about as much as a static one.
+
+    The returned closure carries state tied to `graph`, build a fresh one
+    for every run (and every graph copy).
+    """
+    if ntconfig.evolution == "static":
+        return None
+
+    if ntconfig.evolution == "growth":
+        return _growth_evolution(graph, ntconfig, seed)
+
+    if ntconfig.evolution == "rewire":
+        return _rewire_evolution(graph, ntconfig, seed)
+
+    raise ValueError(f"Unknown evolution: {ntconfig.evolution}")
+
+def evolution_factory(ntconfig: NetTopologyConfig) -> Optional[Callable[[nx.Graph, int], Optional[Evolution]]]:
+    # (graph, seed) -> Evolution, for callers that build one per run; None when static
+    if ntconfig.evolution == "static":
+        return None
+    return lambda graph, seed: build_evolution(graph, ntconfig, seed)
+
+def _growth_evolution(graph: nx.Graph, ntconfig: NetTopologyConfig, seed: int) -> Evolution:
+    rng = random.Random(seed)
+    edge_links = max(1, int(ntconfig.no_linked_edges))
+
+    # weights stay relative to the initial hubs so existing nodes keep their values
+    max_degree = max((d for _, d in graph.degree()), default=0)
+
+    # every node appears once per incident edge -> uniform pick is degree-proportional
+    attachment_pool = [node for edge in graph.edges() for node in edge]
+    attached = set(attachment_pool)
+    next_node = max(graph.nodes(), default=-1) + 1
+
+    def evolve(graph: nx.Graph, iteration: int) -> Tuple[List[Edge], List[Edge]]:
+        nonlocal next_node
+        added: List[Edge] = []
+
+        for _ in range(ntconfig.growth_nodes_per_tick):
+            new_node = next_node
+            next_node += 1
+
+            # at most as many targets as distinct attachable nodes, or the loop never ends
+            if attachment_pool:
+                targets: set[int] = set()
+                wanted = min(edge_links, len(attached))
+                while len(targets) < wanted:
+                    targets.add(rng.choice(attachment_pool))
+            else:
+                targets = set(rng.sample(list(graph.nodes()), min(edge_links, graph.number_of_nodes())))
+
+            graph.add_node(new_node)
+            for target in targets:
+                graph.add_edge(new_node, target)
+                attachment_pool.extend((new_node, target))
+                attached.update((new_node, target))
+                added.append((new_node, target))
+
+            assign_node_weights(graph, max_degree=max_degree, nodes=[new_node, *targets])
+
+        return added, []
+
+    return evolve
+
+def _rewire_evolution(graph: nx.Graph, ntconfig: NetTopologyConfig, seed: int) -> Evolution:
+    rng = random.Random(seed)
+    max_degree = max((d for _, d in graph.degree()), default=0)
+
+    # rewired edges are replaced in place, so the list never needs rebuilding
+    edges: List[Edge] = list(graph.edges())
+    nodes = list(graph.nodes())
+    rewires = int(round(ntconfig.rewire_fraction_per_tick * len(edges)))
+
+    def evolve(graph: nx.Graph, iteration: int) -> Tuple[List[Edge], List[Edge]]:
+        added: List[Edge] = []
+        removed: List[Edge] = []
+
+        for _ in range(rewires):
+            index = rng.randrange(len(edges))
+            u, v = edges[index]
+            w = rng.choice(nodes)
+
+            # as in Watts-Strogatz: keep u, move the far end, no self loops / duplicates
+            if w == u or graph.has_edge(u, w):
+                continue
+
+            graph.remove_edge(u, v)
+            graph.add_edge(u, w)
+            edges[index] = (u, w)
+            removed.append((u, v))
+            added.append((u, w))
+
+            assign_node_weights(graph, max_degree=max_degree, nodes=(v, w))
+
+        return added, removed
+
+    return evolve
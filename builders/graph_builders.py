@@ -1,5 +1,8 @@
 from config import NetTopologyConfig
+from typing import Iterable, Optional, Tuple
 import networkx as nx
+import numpy as np
+import scipy.sparse as sp
 
 def build_graph(ntconfig: NetTopologyConfig) -> nx.Graph:
     set_seed = ntconfig.seed
@@ -34,8 +37,39 @@ def build_graph(ntconfig: NetTopologyConfig) -> nx.Graph:
         graph = nx.powerlaw_cluster_graph(ntconfig.nodes, edge_links, tri_formation_probability, seed=set_seed)
         return graph
 
+    if ntconfig.name == "EDGELIST":
+        if not ntconfig.edge_list_path:
+            raise ValueError("EDGELIST topology needs an edge_list_path")
+        # pandas / scipy are only needed for loaded graphs
+        from builders.edgelist_builders import edge_list_graph
+        return edge_list_graph(ntconfig.edge_list_path, directed=ntconfig.directed)
+
     raise ValueError(f"Unknown topology: {ntconfig.name}")
 
-        
+# Degree-weighted activity / influence (see README "Degree-Weighted Parameters")
+# Pass `nodes` (and a fixed `max_degree`) to refresh only nodes whose degree changed
+def assign_node_weights(
+    graph: nx.Graph, max_degree: Optional[int] = None, nodes: Optional[Iterable[int]] = None
+) -> nx.Graph:
+    if max_degree is None:
+        max_degree = max((d for _, d in graph.degree()), default=0)
+    max_degree = max_degree or 1
+
+    for node in graph.nodes() if nodes is None else nodes:
+        ratio = min(1.0, graph.degree(node) / max_degree)
+        graph.nodes[node]["activity"] = 0.2 + 0.8 * ratio
+        graph.nodes[node]["influence"] = 0.02 + 0.08 * ratio
+    return graph
 
+def csr_degrees(adjacency: sp.csr_array, directed: bool) -> np.ndarray:
+    # graph.degree() for a CSR adjacency, in + out for directed graphs
+    degrees = np.diff(adjacency.indptr)
+    if directed:
+        degrees = degrees + np.bincount(adjacency.indices, minlength=adjacency.shape[0])
+    return degrees
 
+def degree_weights(degrees: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # assign_node_weights for a degree array, (activity, influence) per node
+    max_degree = max(int(degrees.max()) if len(degrees) else 0, 1)
+    ratio = np.minimum(1.0, degrees / max_degree)
+    return 0.2 + 0.8 * ratio, 0.02 + 0.08 * ratio
@@ -0,0 +1,207 @@
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+import networkx as nx
+import plotly.graph_objects as go
+
+from layout.draw import draw_active_edges, update_colors_per_frame
+from builders.result_cache import shared_cache
+
+# number of cascades whose history is kept in process for paged playback;
+# histories also go to the shared cache so any worker can serve a chunk
+PLAYBACK_CACHE_SIZE = 16
+
+_playback_cache: "OrderedDict[str, Tuple[nx.Graph, Dict[int, Tuple[float, float]], List[dict]]]" = OrderedDict()
+_playback_lock = threading.Lock()
+
+
+def is_evolving(iterations: List[dict]) -> bool:
+    return any(iteration.get("added_edges") or iteration.get("removed_edges") for iteration in iterations)
+
+
+def evolution_traces() -> List[go.Scatter]:
+    # appended after (static edges, active edges, nodes) for evolving networks
+    return [
+        go.Scatter(x=[], y=[], mode="lines", line=dict(color="#16a34a", width=0.8),
+                   hoverinfo="none", name="added_edges"),
+        go.Scatter(x=[], y=[], mode="lines", line=dict(color="#f87171", width=0.8, dash="dot"),
+                   hoverinfo="none", name="removed_edges"),
+    ]
+
+
+class _TopologyReplay:
+    """
+    Edge changes relative to the initial graph, replayed from the per-tick
+    added_edges / removed_edges of a cascade history.
+    """
+
+    def __init__(self, graph: nx.Graph):
+        self.directed = graph.is_directed()
+        self.initial = set(graph.nodes())
+        self.nodes = list(graph.nodes())
+        self.degrees = dict(graph.degree())
+        self.added: Set[Tuple[int, int]] = set()
+        self.removed: Set[Tuple[int, int]] = set()
+
+    def _key(self, u: int, v: int) -> Tuple[int, int]:
+        return (u, v) if self.directed or u <= v else (v, u)
+
+    def apply(self, iteration: dict) -> None:
+        for u, v in iteration.get("removed_edges", []):
+            key = self._key(u, v)
+            if key in self.added:
+                self.added.discard(key)
+            else:
+                self.removed.add(key)
+            self.degrees[u] -= 1
+            self.degrees[v] -= 1
+
+        for u, v in iteration.get("added_edges", []):
+            # nodes are born in this order, matching the evolved graph's node order
+            for node in (u, v):
+                if node not in self.degrees:
+                    self.nodes.append(node)
+                    self.degrees[node] = 0
+            key = self._key(u, v)
+            if key in self.removed:
+                self.removed.discard(key)
+            else:
+                self.added.add(key)
+            self.degrees[u] += 1
+            self.degrees[v] += 1
+
+
+def build_frames(
+    graph: nx.Graph,
+    loc: Dict[int, Tuple[float, float]],
+    iterations: List[dict],
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> List[go.Frame]:
+    """
+    Animation frames for iterations[start:stop]. `graph` is the initial
+    graph the figure was drawn from; for evolving networks every frame also
+    redraws the node trace and the added / removed edge overlays from the
+    edge events up to that tick.
+    """
+    # every history entry is a full snapshot, so any slice can be rendered on its own
+    window = iterations[start:stop]
+
+    if is_evolving(iterations):
+        return _evolving_frames(graph, loc, iterations, start, window)
+
+    frames, _ = update_colors_per_frame(graph, window)
+
+    return [
+        go.Frame(
+            name=frame.name,
+            data=[
+                draw_active_edges(
+                    iteration["active_edges"],
+                    loc,
+                ),
+                go.Scatter(marker=frame.data[0].marker),
+            ],
+            traces=[1, 2],
+            layout=frame.layout,
+        )
+        for frame, iteration in zip(frames, window)
+    ]
+
+
+def _positions_only(trace: go.Scatter) -> go.Scatter:
+    # keeps the overlay's own line style when the frame is applied
+    return go.Scatter(x=trace.x, y=trace.y)
+
+
+def _evolving_frames(
+    graph: nx.Graph,
+    loc: Dict[int, Tuple[float, float]],
+    iterations: List[dict],
+    start: int,
+    window: List[dict],
+) -> List[go.Frame]:
+    # node states are snapshots, but the topology is only known by replaying its events
+    replay = _TopologyReplay(graph)
+    for iteration in iterations[:start]:
+        replay.apply(iteration)
+
+    frames = []
+    for iteration in window:
+        replay.apply(iteration)
+        nodes = list(replay.nodes)
+        (frame,), _ = update_colors_per_frame(graph, [iteration], nodes=nodes)
+        colors = frame.data[0].marker.color
+
+        frames.append(
+            go.Frame(
+                name=frame.name,
+                data=[
+                    draw_active_edges(iteration["active_edges"], loc),
+                    go.Scatter(
+                        x=[loc[node][0] for node in nodes],
+                        y=[loc[node][1] for node in nodes],
+                        text=[
+                            f"node={node}<br>degree_distribution={replay.degrees[node]}<br>state={colors[i]}"
+                            for i, node in enumerate(nodes)
+                        ],
+                        marker=frame.data[0].marker,
+                    ),
+                    _positions_only(draw_active_edges(replay.added, loc)),
+                    _positions_only(draw_active_edges(replay.removed, loc)),
+                ],
+                traces=[1, 2, 3, 4],
+                layout=frame.layout,
+            )
+        )
+    return frames
+
+
+def cache_playback(
+    graph: nx.Graph,
+    loc: Dict[int, Tuple[float, float]],
+    iterations: List[dict],
+) -> str:
+    token = uuid.uuid4().hex
+    _remember(token, (graph, loc, iterations))
+    shared_cache().set(f"playback:{token}", (graph, loc, iterations))
+    return token
+
+
+def _remember(token: str, entry: Tuple[nx.Graph, Dict[int, Tuple[float, float]], List[dict]]) -> None:
+    with _playback_lock:
+        _playback_cache[token] = entry
+        while len(_playback_cache) > PLAYBACK_CACHE_SIZE:
+            _playback_cache.popitem(last=False)
+
+
+def _lookup(token: str) -> Optional[Tuple[nx.Graph, Dict[int, Tuple[float, float]], List[dict]]]:
+    with _playback_lock:
+        entry = _playback_cache.get(token)
+        if entry is not None:
+            _playback_cache.move_to_end(token)
+            return entry
+
+    entry = shared_cache().get(f"playback:{token}")
+    if entry is not None:
+        _remember(token, entry)
+    return entry
+
+
+def has_playback(token: str) -> bool:
+    return _lookup(token) is not None
+
+
+def playback_chunk(token: str, start: int, size: int) -> List[dict]:
+    """
+    Frames [start, start + size) of a cached cascade as plotly JSON, ready for
+    Plotly.addFrames. Unknown / evicted tokens yield an empty chunk.
+    """
+    entry = _lookup(token)
+    if entry is None:
+        return []
+
+    graph, loc, iterations = entry
+    frames = build_frames(graph, loc, iterations, start=start, stop=start + size)
+    return [frame.to_plotly_json() for frame in frames]
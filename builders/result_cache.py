@@ -0,0 +1,198 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import stat
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Iterator, Optional
+
+# shared by every worker process of the same user (e.g. gunicorn -w N); entries
+# are pickles, so the cache lives in a private per-user directory, never in /tmp
+CACHE_PATH = os.environ.get(
+    "CASCADESIM_CACHE_PATH",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "cascadesim",
+        "cache.sqlite3",
+    ),
+)
+CACHE_MAX_BYTES = int(os.environ.get("CASCADESIM_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+
+# an in-flight computation older than this is assumed to belong to a dead worker
+INFLIGHT_TIMEOUT = 900.0
+POLL_INTERVAL = 0.1
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(*parts: Any) -> str:
+    # dataclasses are expanded field by field so every config value is part of the key
+    normalised = [asdict(part) if is_dataclass(part) else part for part in parts]
+    payload = json.dumps(normalised, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _check_private(path: str) -> None:
+    # anyone who can write the cache can make us unpickle arbitrary objects
+    info = os.stat(path)
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        raise PermissionError(f"Cache path {path} is not owned by the current user")
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"Cache path {path} is writable by other users")
+
+
+def _secure_location(path: str) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    _check_private(directory)
+
+    # created private up front; sqlite gives its side files the same mode
+    os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+
+    # the database and its WAL / shm side files
+    for candidate in (path, f"{path}-wal", f"{path}-shm"):
+        if os.path.exists(candidate):
+            _check_private(candidate)
+
+
+class SharedCache:
+    """
+    Size-bounded LRU cache in a local SQLite file, safe to share between
+    processes. get_or_compute coalesces concurrent identical requests: the
+    first caller computes, the others wait for its result (single flight).
+    """
+
+    def __init__(self, path: str = CACHE_PATH, max_bytes: int = CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.owner = uuid.uuid4().hex
+
+        _secure_location(path)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS inflight ("
+                "key TEXT PRIMARY KEY, owner TEXT NOT NULL, started REAL NOT NULL)"
+            )
+            # keys whose result is larger than max_bytes: waiting on them gains nothing
+            connection.execute("CREATE TABLE IF NOT EXISTS oversize (key TEXT PRIMARY KEY)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # autocommit mode, transactions are opened explicitly where needed
+        connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._connect() as connection:
+            row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any) -> bool:
+        # False when the value is too large to be cached
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            with self._connect() as connection:
+                connection.execute("INSERT OR IGNORE INTO oversize (key) VALUES (?)", (key,))
+            logger.warning(
+                "Result for %s is %d bytes, over the %d byte cache budget; not cached or coalesced",
+                key, len(blob), self.max_bytes,
+            )
+            return False
+
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time()),
+            )
+
+            # evict least recently used entries until back under budget
+            total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                for old_key, size in connection.execute(
+                    "SELECT key, size FROM entries WHERE key != ? ORDER BY accessed ASC", (key,)
+                ).fetchall():
+                    connection.execute("DELETE FROM entries WHERE key = ?", (old_key,))
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+            connection.execute("COMMIT")
+        return True
+
+    def delete(self, key: str) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            connection.execute("DELETE FROM oversize WHERE key = ?", (key,))
+
+    def _is_oversize(self, key: str) -> bool:
+        with self._connect() as connection:
+            return connection.execute("SELECT 1 FROM oversize WHERE key = ?", (key,)).fetchone() is not None
+
+    def _claim(self, key: str) -> bool:
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "DELETE FROM inflight WHERE key = ? AND started < ?",
+                (key, time.time() - INFLIGHT_TIMEOUT),
+            )
+            claimed = connection.execute(
+                "INSERT OR IGNORE INTO inflight (key, owner, started) VALUES (?, ?, ?)",
+                (key, self.owner, time.time()),
+            ).rowcount == 1
+            connection.execute("COMMIT")
+        return claimed
+
+    def _release(self, key: str) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM inflight WHERE key = ? AND owner = ?", (key, self.owner))
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+
+            # an oversize result never reaches the cache, so waiters would only
+            # recompute it one after another; compute in parallel instead
+            if self._is_oversize(key):
+                return compute()
+
+            if self._claim(key):
+                try:
+                    # another worker may have finished between our lookup and claim
+                    value = self.get(key)
+                    if value is None:
+                        value = compute()
+                        self.set(key, value)
+                    return value
+                finally:
+                    self._release(key)
+
+            time.sleep(POLL_INTERVAL)
+
+
+_shared_cache: Optional[SharedCache] = None
+
+
+def shared_cache() -> SharedCache:
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = SharedCache()
+    return _shared_cache
@@ -1,13 +1,58 @@
 import networkx as nx
 import numpy as np
-from typing import List
-import random
+from typing import Callable, List, Optional, Sequence, Tuple
 from config import CascadeConfig
 
+# reacting node -> broadcaster promotion, and broadcaster survival per tick
+PROMOTION_PROBABILITY = 0.15
+RETENTION_PROBABILITY = 0.4
+
+# keyed_uniforms streams: (activity, retention) per node, (influence, promotion) per edge
+NODE_STREAM, EDGE_STREAM = 1, 2
+
+_MASK = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+
+def _mix(x: int) -> int:
+    # splitmix64 finaliser on python ints, for the per-tick key
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+def _mix_array(x: np.ndarray) -> np.ndarray:
+    # the same finaliser on uint64 arrays, where overflow wraps
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def keyed_uniforms(
+        seed: int, stream: int, tick: int, nodes: Sequence[int], partners: Optional[Sequence[int]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Two independent uniforms in [0, 1) per key, each a pure function of
+    (seed, stream, tick, node[, partner]).
+
+    Unlike a sequential generator, the draw a node (or a directed edge
+    node -> partner) sees does not depend on how many draws were consumed
+    before it, so a node or edge shared by two topologies gets the same
+    uniforms in runs with the same seed.
+    """
+    key = _mix((_mix((seed * _GOLDEN) & _MASK) ^ _mix((stream * _GOLDEN + tick) & _MASK)) & _MASK)
+
+    with np.errstate(over="ignore"):
+        values = _mix_array(np.asarray(nodes, dtype=np.int64).astype(np.uint64) * np.uint64(_GOLDEN) ^ np.uint64(key))
+        if partners is not None:
+            partner_keys = (np.asarray(partners, dtype=np.int64).astype(np.uint64) + np.uint64(1)) * np.uint64(_GOLDEN)
+            values = _mix_array(values ^ partner_keys)
+
+    # the high and low 32 bits of one hash are two uniforms
+    scale = 1.0 / (1 << 32)
+    return (values >> np.uint64(32)) * scale, (values & np.uint64(0xFFFFFFFF)) * scale
+
 def run_custom_cascade(
-        graph: nx.Graph, cascade: CascadeConfig
+        graph: nx.Graph, cascade: CascadeConfig,
+        evolve: Optional[Callable[[nx.Graph, int], Tuple[list, list]]] = None
         ) -> List[dict]:
-    random.seed(cascade.seed)
     np.random.seed(cascade.seed)
 
     idle, broadcasting, reacting = 0, 1, 2
@@ -17,56 +62,92 @@ def run_custom_cascade(
     # set no. of initial influencers in system
     initial_influencer_count = max(1, int(len(nodes) * cascade.fraction_infected))
 
-    # choose broadcasting nodes at random
-    broadcasting_nodes = set(np.random.choice(nodes, size=initial_influencer_count, replace=False))
+    # choose broadcasting nodes at random, unless a seed set was selected
+    if cascade.seed_nodes:
+        broadcasting_nodes = set(cascade.seed_nodes)
+    else:
+        broadcasting_nodes = set(np.random.choice(nodes, size=initial_influencer_count, replace=False))
 
     # baseline state of all nodes
     base_node_state = {node: idle for node in nodes}
     
     # var to store all iters node statuses and info
     history: List[dict] = []
+    non_idle: set[int] = set()
 
     for iteration in range(cascade.iterations):
+        added_edges, removed_edges = [], []
+
+        # temporal networks: apply this tick's edge events to the graph in place
+        if evolve is not None:
+            added_edges, removed_edges = evolve(graph, iteration)
+            for u, v in added_edges:
+                for node in (u, v):
+                    if node not in base_node_state:
+                        base_node_state[node] = idle
+                        nodes.append(node)
+
         new_broadcasters: set[int] = set()
         reacting_nodes: set[int] = set()
         active_edges = set()
         broadcaster_impacts = {}
         
-        for node in nodes:
-            # decay BOTH reacting and broadcasting back to idle each tick
-            if base_node_state[node] in (broadcasting, reacting):
-                base_node_state[node] = idle
-
-        for node in broadcasting_nodes:
+        # decay BOTH reacting and broadcasting back to idle each tick; only
+        # last tick's broadcasters / reacting nodes can be non-idle
+        for node in non_idle:
+            base_node_state[node] = idle
+
+        # draws are keyed by (tick, node) and (tick, node, neighbour) rather
+        # than consumed in iteration order, and drawn once per tick
+        broadcasters = list(broadcasting_nodes)
+        activity_draws, retention_draws = keyed_uniforms(cascade.seed, NODE_STREAM, iteration, broadcasters)
+
+        sources: List[int] = []
+        targets: List[int] = []
+        thresholds: List[float] = []
+        for node, activity_draw in zip(broadcasters, activity_draws):
             base_node_state[node] = broadcasting
             broadcaster_impacts[node] = 0
 
-            activity = graph.nodes[node].get("activity", 0.0)
-            influence = graph.nodes[node].get("influence", 0.0)
-
-            if random.random() > activity:
+            if activity_draw > graph.nodes[node].get("activity", 0.0):
                 continue
-            
-            for neighbor in graph.neighbors(node):
-                
-                # local attention horizon, caps nodes from being attached to entire network
-                if random.random() < influence:
-                    reacting_nodes.add(neighbor)
-                    broadcaster_impacts[node] += 1
-                    active_edges.add((node, neighbor))
-                
-                    # promote to broadcaster only if node reacts
-                    if random.random() < 0.15:
-                        new_broadcasters.add(neighbor)
+
+            neighbors = list(graph.neighbors(node))
+            sources.extend([node] * len(neighbors))
+            targets.extend(neighbors)
+            thresholds.extend([graph.nodes[node].get("influence", 0.0)] * len(neighbors))
+
+        if sources:
+            influence_draws, promotion_draws = keyed_uniforms(cascade.seed, EDGE_STREAM, iteration, sources, targets)
+
+            # local attention horizon, caps nodes from being attached to entire network
+            reached = influence_draws < np.asarray(thresholds)
+
+            # promote to broadcaster only if node reacts
+            promoted = reached & (promotion_draws < PROMOTION_PROBABILITY)
+
+            for index in np.flatnonzero(reached).tolist():
+                node, neighbor = sources[index], targets[index]
+                reacting_nodes.add(neighbor)
+                broadcaster_impacts[node] += 1
+                active_edges.add((node, neighbor))
+
+            new_broadcasters.update(targets[index] for index in np.flatnonzero(promoted).tolist())
         
         for node in reacting_nodes:
             if base_node_state[node] != broadcasting:
                 base_node_state[node] = reacting
+        non_idle = reacting_nodes | set(broadcasters)
             
         # broadcasters decay after info burst
-        broadcasting_nodes = (new_broadcasters | {n for n in broadcasting_nodes if random.random() < 0.4})
+        broadcasting_nodes = (new_broadcasters | {n for n, u in zip(broadcasters, retention_draws) if u < RETENTION_PROBABILITY})
         if not broadcasting_nodes:
-            broadcasting_nodes = set(np.random.choice(nodes, size=initial_influencer_count, replace=False))
+            if cascade.seed_nodes:
+                broadcasting_nodes = set(cascade.seed_nodes)
+            else:
+                # keyed by tick so the reseed set does not depend on earlier extinctions
+                reseed = np.random.default_rng([cascade.seed, iteration])
+                broadcasting_nodes = set(reseed.choice(nodes, size=initial_influencer_count, replace=False))
 
         
         # record snapshot
@@ -76,7 +157,9 @@ def run_custom_cascade(
             "iteration": iteration,
             "status": node_status,
             "broadcaster_impacts": broadcaster_impacts,
-            "active_edges": list(active_edges)
+            "active_edges": list(active_edges),
+            "added_edges": added_edges,
+            "removed_edges": removed_edges
         })
     
     return history
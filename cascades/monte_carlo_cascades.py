@@ -1,5 +1,7 @@
+from dataclasses import replace
 import networkx as nx
 import numpy as np
+from typing import Callable, Optional
 from config import CascadeConfig
 from cascades.custom_cascades import run_custom_cascade
 from cascades.timeseries_cascades import cascade_timeseries
@@ -7,19 +9,26 @@ from cascades.timeseries_cascades import cascade_timeseries
 def cascade_size_monte_carlo(
         graph: nx.Graph,
         config: CascadeConfig,
-        runs: int = 25
+        runs: int = 25,
+        evolution: Optional[Callable[[nx.Graph, int], Optional[Callable]]] = None
 ) -> np.ndarray:
+    # evolution(graph, seed) builds the per-tick evolve callback for one run
     sizes = []
     base_seed = config.seed
 
+    # the per-run seed schedule only depends on the config, and the cascade
+    # keys its draws by (run, tick, node[, neighbour]), so shared nodes and
+    # edges see the same draws in every topology
     for run in range(runs):
-        cascade_information = CascadeConfig(
-            fraction_infected=config.fraction_infected,
-            influence_probability=config.influence_probability,
-            iterations=config.iterations,
-            seed=base_seed + run * 17 
-        )
-        init_cascade = run_custom_cascade(graph, cascade_information)
+        cascade_information = replace(config, seed=base_seed + run * 17)
+
+        # evolving networks get a fresh copy per run so runs stay independent
+        run_graph, evolve = graph, None
+        if evolution is not None:
+            run_graph = graph.copy()
+            evolve = evolution(run_graph, cascade_information.seed)
+
+        init_cascade = run_custom_cascade(run_graph, cascade_information, evolve=evolve)
         init_timeseries = cascade_timeseries(init_cascade, graph.number_of_nodes())
         if len(init_timeseries) > 0:
             sizes.append(float(init_timeseries["total_responses"].sum()))
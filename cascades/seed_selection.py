@@ -0,0 +1,221 @@
+import heapq
+from dataclasses import replace
+from typing import List, Optional
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+from config import CascadeConfig
+from cascades.custom_cascades import PROMOTION_PROBABILITY, RETENTION_PROBABILITY
+from cascades.monte_carlo_cascades import cascade_size_monte_carlo
+
+SEEDING_STRATEGIES = ("random", "degree", "celf", "rr")
+
+# CELF: only the top-degree nodes are candidates, and each spread estimate
+# uses a few common-random-number Monte Carlo runs
+CELF_CANDIDATES = 20
+CELF_RUNS = 5
+
+# each greedy step costs Monte Carlo runs per stale candidate, so only the
+# first CELF_MAX_SEEDS seeds are picked greedily; with 5-run estimates the
+# later marginal gains are mostly noise, the rest of the budget goes by degree
+CELF_MAX_SEEDS = 10
+
+# reverse-reachable sets sampled per selection
+RR_SAMPLES = 20000
+
+def seed_count(graph: nx.Graph, cascade: CascadeConfig) -> int:
+    # same budget as random seeding in run_custom_cascade
+    return max(1, int(graph.number_of_nodes() * cascade.fraction_infected))
+
+def degree_seeds(graph: nx.Graph, k: int) -> List[int]:
+    return [node for node, _ in sorted(graph.degree(), key=lambda item: item[1], reverse=True)[:k]]
+
+def top_degree_nodes(degrees: np.ndarray, k: int) -> List[int]:
+    # degree_seeds for a degree array indexed by dense label
+    return np.argsort(-degrees, kind="stable")[:k].tolist()
+
+def celf_seeds(
+        graph: nx.Graph,
+        cascade: CascadeConfig,
+        k: int,
+        runs: int = CELF_RUNS,
+        candidates: int = CELF_CANDIDATES,
+        max_seeds: int = CELF_MAX_SEEDS
+) -> List[int]:
+    """
+    Lazy-greedy (CELF) seed selection on top of cascade_size_monte_carlo.
+
+    Spread is treated as submodular, so a node's stale gain is an upper
+    bound: only the heap top is re-evaluated, and it is accepted once its
+    gain is fresh for the current seed set. Past max_seeds, the remaining
+    seeds are the highest-degree nodes not yet chosen.
+    """
+    def spread(seeds: List[int]) -> float:
+        config = replace(cascade, seeding="random", seed_nodes=tuple(seeds))
+        return float(cascade_size_monte_carlo(graph, config, runs=runs).mean())
+
+    greedy_k = min(k, max_seeds)
+
+    # greedy_k + candidates so there is always a choice beyond the top nodes by degree
+    pool = degree_seeds(graph, greedy_k + candidates)
+
+    # (-gain, node, size of the seed set the gain was computed for)
+    heap = [(-spread([node]), node, 0) for node in pool]
+    heapq.heapify(heap)
+
+    seeds: List[int] = []
+    current = 0.0
+    while heap and len(seeds) < greedy_k:
+        negative_gain, node, evaluated_at = heapq.heappop(heap)
+
+        if evaluated_at == len(seeds):
+            seeds.append(node)
+            current += -negative_gain
+            continue
+
+        gain = spread(seeds + [node]) - current
+        heapq.heappush(heap, (-gain, node, len(seeds)))
+
+    if len(seeds) < k:
+        chosen = set(seeds)
+        seeds.extend(node for node in degree_seeds(graph, k + len(seeds)) if node not in chosen)
+        del seeds[k:]
+
+    return seeds
+
+def rr_seeds(
+        graph: nx.Graph,
+        cascade: CascadeConfig,
+        k: int,
+        samples: int = RR_SAMPLES
+) -> List[int]:
+    # rr_seeds_csr on the graph's adjacency, mapped back to node labels
+    nodes = list(graph.nodes())
+    adjacency = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight=None, format="csr")
+    activity = np.array([graph.nodes[node].get("activity", 0.0) for node in nodes], dtype=float)
+    influence = np.array([graph.nodes[node].get("influence", 0.0) for node in nodes], dtype=float)
+    return [nodes[index] for index in rr_seeds_csr(adjacency, activity, influence, cascade, k, samples)]
+
+def rr_seeds_csr(
+        adjacency: sp.csr_array,
+        activity: np.ndarray,
+        influence: np.ndarray,
+        cascade: CascadeConfig,
+        k: int,
+        samples: int = RR_SAMPLES
+) -> List[int]:
+    """
+    Reverse-reachable set sampling for large graphs, on a CSR adjacency
+    (rows = source); returns row indices.
+
+    The cascade is approximated as independent cascade: a broadcaster
+    stays for 1 / (1 - retention) ticks on average, so it reaches a
+    neighbour with p = 1 - (1 - activity * influence) ** lifetime. Reaching
+    the target only needs that last hop; reaching it through an
+    intermediate node also needs the intermediate to be promoted. Seeds are
+    picked by greedy maximum coverage over the sampled RR sets.
+
+    All samples are grown together, one reverse BFS level at a time, and
+    the RR sets are kept as flat (sample, node) arrays.
+    """
+    n = adjacency.shape[0]
+    if n == 0:
+        return []
+
+    rng = np.random.default_rng(cascade.seed)
+    lifetime = 1.0 / (1.0 - RETENTION_PROBABILITY)
+    reach = 1.0 - (1.0 - activity * influence) ** lifetime
+
+    # rows of the transpose are predecessors
+    incoming = adjacency.T.tocsr()
+    indptr = np.asarray(incoming.indptr, dtype=np.int64)
+
+    frontier_sets = np.arange(samples, dtype=np.int64)
+    frontier_nodes = rng.integers(0, n, size=samples)
+    rr_sets, rr_nodes = [frontier_sets], [frontier_nodes]
+    # visited (sample, node) pairs as sorted keys sample * n + node
+    visited = np.sort(frontier_sets * n + frontier_nodes)
+
+    hop_probability = reach
+    while len(frontier_nodes):
+        counts = indptr[frontier_nodes + 1] - indptr[frontier_nodes]
+        owner = np.repeat(np.arange(len(frontier_nodes)), counts)
+        edge_index = np.repeat(indptr[frontier_nodes] - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+        sources = np.asarray(incoming.indices[edge_index], dtype=np.int64)
+        keys = frontier_sets[owner] * n + sources
+
+        position = np.minimum(np.searchsorted(visited, keys), len(visited) - 1)
+        live = (visited[position] != keys) & (rng.random(len(keys)) < hop_probability[sources])
+        keys = np.unique(keys[live])
+
+        visited = np.union1d(visited, keys)
+        frontier_sets, frontier_nodes = keys // n, keys % n
+        rr_sets.append(frontier_sets)
+        rr_nodes.append(frontier_nodes)
+
+        # past the target, a hop also needs the intermediate to be promoted
+        hop_probability = reach * PROMOTION_PROBABILITY
+
+    rr_sets = np.concatenate(rr_sets)
+    rr_nodes = np.concatenate(rr_nodes)
+
+    # node -> RR sets it covers, RR set -> its nodes, both CSR-style
+    by_node = np.argsort(rr_nodes, kind="stable")
+    cover_sets = rr_sets[by_node]
+    cover_ptr = np.concatenate(([0], np.cumsum(np.bincount(rr_nodes, minlength=n))))
+    by_set = np.argsort(rr_sets, kind="stable")
+    member_nodes = rr_nodes[by_set]
+    member_ptr = np.concatenate(([0], np.cumsum(np.bincount(rr_sets, minlength=samples))))
+
+    # lazy greedy max coverage: counts only drop, so a popped entry whose
+    # count is still current is the maximum (ties go to the lower index)
+    counts = np.bincount(rr_nodes, minlength=n)
+    covered = np.zeros(samples, dtype=bool)
+    heap = [(-int(counts[node]), int(node)) for node in np.flatnonzero(counts)]
+    heapq.heapify(heap)
+
+    seeds: List[int] = []
+    k = min(k, n)
+    while heap and len(seeds) < k:
+        negative_count, node = heapq.heappop(heap)
+        if -negative_count != counts[node]:
+            if counts[node] > 0:
+                heapq.heappush(heap, (-int(counts[node]), node))
+            continue
+
+        seeds.append(node)
+        newly_covered = cover_sets[cover_ptr[node]:cover_ptr[node + 1]]
+        newly_covered = newly_covered[~covered[newly_covered]]
+        covered[newly_covered] = True
+
+        sizes = member_ptr[newly_covered + 1] - member_ptr[newly_covered]
+        members = member_nodes[
+            np.repeat(member_ptr[newly_covered] - (np.cumsum(sizes) - sizes), sizes) + np.arange(sizes.sum())
+        ]
+        np.subtract.at(counts, members, 1)
+
+    # every RR set is covered, the rest of the budget adds nothing
+    if len(seeds) < k:
+        chosen = set(seeds)
+        seeds.extend(node for node in range(n) if node not in chosen)
+        del seeds[k:]
+
+    return seeds
+
+def select_seeds(graph: nx.Graph, cascade: CascadeConfig) -> Optional[List[int]]:
+    # None keeps the uniform random seeding of run_custom_cascade
+    k = seed_count(graph, cascade)
+
+    if cascade.seeding == "random":
+        return None
+
+    if cascade.seeding == "degree":
+        return degree_seeds(graph, k)
+
+    if cascade.seeding == "celf":
+        return celf_seeds(graph, cascade, k)
+
+    if cascade.seeding == "rr":
+        return rr_seeds(graph, cascade, k)
+
+    raise ValueError(f"Unknown seeding strategy: {cascade.seeding}")
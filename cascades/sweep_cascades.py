@@ -0,0 +1,157 @@
+from dataclasses import replace
+import networkx as nx
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from typing import Optional, Sequence
+from config import CascadeConfig
+from cascades.custom_cascades import (
+    EDGE_STREAM,
+    NODE_STREAM,
+    PROMOTION_PROBABILITY,
+    RETENTION_PROBABILITY,
+    keyed_uniforms,
+)
+
+# log-spaced grid matching the dashboard's influence slider
+DEFAULT_SWEEP_PROBABILITIES = np.logspace(-3, -0.5, 40)
+
+# lanes x firing edges evaluated at once, bounds the per-tick temporaries
+SWEEP_MAX_CELLS = 8_000_000
+
+def influence_sweep(
+        graph: nx.Graph,
+        cascade: CascadeConfig,
+        probabilities: Optional[Sequence[float]] = None,
+        runs: int = 5
+) -> pd.DataFrame:
+    """
+    Cascade size against influence probability, for every probability at once.
+
+    Each run uses one set of keyed draws (keyed_uniforms, as in
+    run_custom_cascade) and replays the cascade for all probabilities on those
+    same draws, so neighbouring grid points differ only through p and the
+    curve costs roughly one simulation per run instead of one per point.
+
+    The edge i -> j transmits when u < p * influence_i / max(influence), so
+    the degree-weighted influence profile is kept and p is the influence of
+    the strongest hub; at p = max(influence) each lane follows the same law
+    as run_custom_cascade.
+    """
+    nodes = list(graph.nodes())
+
+    adjacency = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight=None, format="csr")
+    activity = np.array([graph.nodes[node].get("activity", 0.0) for node in nodes], dtype=float)
+    influence = np.array([graph.nodes[node].get("influence", 0.0) for node in nodes], dtype=float)
+
+    if cascade.seed_nodes:
+        index = {node: i for i, node in enumerate(nodes)}
+        cascade = replace(cascade, seed_nodes=tuple(index[node] for node in cascade.seed_nodes))
+
+    return influence_sweep_csr(adjacency, activity, influence, cascade, probabilities, runs)
+
+def influence_sweep_csr(
+        adjacency: sp.csr_array,
+        activity: np.ndarray,
+        influence: np.ndarray,
+        cascade: CascadeConfig,
+        probabilities: Optional[Sequence[float]] = None,
+        runs: int = 5
+) -> pd.DataFrame:
+    """
+    influence_sweep on a CSR adjacency (rows = source) with per-row
+    activity / influence; cascade.seed_nodes, if set, are row indices.
+
+    Only broadcasting nodes are held per lane and only their out-edges are
+    drawn, so a tick costs O(lanes x firing edges) rather than O(lanes x m).
+    """
+    if probabilities is None:
+        probabilities = DEFAULT_SWEEP_PROBABILITIES
+    probabilities = np.asarray(probabilities, dtype=float)
+
+    n = adjacency.shape[0]
+    lanes = len(probabilities)
+
+    if n == 0 or lanes == 0:
+        return pd.DataFrame(columns=["influence_probability", "cascade_size", "cascade_size_std"])
+
+    indptr = np.asarray(adjacency.indptr, dtype=np.int64)
+    indices = adjacency.indices
+
+    top = influence.max()
+    relative_influence = influence / top if top > 0 else influence
+
+    initial_influencer_count = max(1, int(n * cascade.fraction_infected))
+    seed_index = np.unique(np.asarray(cascade.seed_nodes, dtype=np.int64)) if cascade.seed_nodes else None
+
+    sizes = np.zeros((runs, lanes), dtype=float)
+    for run in range(runs):
+        seed = cascade.seed + run * 17
+
+        # members = nodes broadcasting in at least one lane, state[lane, k] = members[k] broadcasts in lane
+        if seed_index is None:
+            members = np.unique(np.random.RandomState(seed).choice(n, size=initial_influencer_count, replace=False))
+        else:
+            members = seed_index
+        state = np.ones((lanes, len(members)), dtype=bool)
+
+        for tick in range(cascade.iterations):
+            activity_draws, retention_draws = keyed_uniforms(seed, NODE_STREAM, tick, members)
+            fired = np.flatnonzero(activity_draws <= activity[members])
+
+            # out-edges of the fired members, in CSR order
+            sources = members[fired]
+            counts = indptr[sources + 1] - indptr[sources]
+            owner = np.repeat(np.arange(len(fired)), counts)
+            edge_index = np.repeat(indptr[sources] - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+            edge_sources = sources[owner]
+            targets = np.asarray(indices[edge_index], dtype=np.int64)
+
+            influence_draws, promotion_draws = keyed_uniforms(seed, EDGE_STREAM, tick, edge_sources, targets)
+            # u < p * relative_influence  <=>  u / relative_influence < p
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scaled_draws = influence_draws / relative_influence[edge_sources]
+            promotable = promotion_draws < PROMOTION_PROBABILITY
+
+            lane_ids = []
+            node_ids = []
+            fired_state = state[:, fired]
+            batch = max(1, SWEEP_MAX_CELLS // max(1, len(targets)))
+            for start in range(0, lanes, batch):
+                stop = min(lanes, start + batch)
+                transmit = fired_state[start:stop][:, owner] & (scaled_draws[None, :] < probabilities[start:stop, None])
+                sizes[run, start:stop] += transmit.sum(axis=1)
+
+                lane, edge = np.nonzero(transmit & promotable[None, :])
+                lane_ids.append(lane + start)
+                node_ids.append(targets[edge])
+
+            lane, member = np.nonzero(state & (retention_draws < RETENTION_PROBABILITY)[None, :])
+            lane_ids.append(lane)
+            node_ids.append(members[member])
+
+            lane_ids = np.concatenate(lane_ids)
+            node_ids = np.concatenate(node_ids)
+
+            # lanes where nobody broadcasts any more are re-seeded, as in run_custom_cascade
+            extinct = np.ones(lanes, dtype=bool)
+            extinct[lane_ids] = False
+            if extinct.any():
+                if seed_index is None:
+                    reseed = np.random.default_rng([seed, tick]).choice(n, size=initial_influencer_count, replace=False)
+                else:
+                    reseed = seed_index
+                extinct = np.flatnonzero(extinct)
+                lane_ids = np.concatenate([lane_ids, np.repeat(extinct, len(reseed))])
+                node_ids = np.concatenate([node_ids, np.tile(reseed, len(extinct))])
+
+            members, member_of = np.unique(node_ids, return_inverse=True)
+            state = np.zeros((lanes, len(members)), dtype=bool)
+            state[lane_ids, member_of] = True
+
+    normalised = sizes / n
+    return pd.DataFrame({
+        "influence_probability": probabilities,
+        "cascade_size": normalised.mean(axis=0),
+        "cascade_size_std": normalised.std(axis=0),
+    })
@@ -1,4 +1,6 @@
+import os
 from dataclasses import dataclass
+from typing import Optional, Tuple
 
 @dataclass
 class NetTopologyConfig:
@@ -20,6 +22,15 @@ class NetTopologyConfig:
     # Holme-Kim
     tri_formation_probability: float = 0.3
 
+    # Temporal evolution while the cascade runs: "static", "growth" (BA-style
+    # preferential attachment continues) or "rewire" (WS-style rewiring)
+    evolution: str = "static"
+    growth_nodes_per_tick: int = 1
+    rewire_fraction_per_tick: float = 0.01
+
+    # Edge list loader: SNAP-style text / gzip file, `nodes` is ignored
+    edge_list_path: Optional[str] = None
+
 @dataclass
 class CascadeConfig:
     fraction_infected: float = 0.01
@@ -30,6 +41,11 @@ class CascadeConfig:
     iterations: int = 60
     seed: int = 25
 
+    # Initial broadcasters: "random", "degree", "celf" or "rr"
+    # (see cascades/seed_selection.py); seed_nodes holds the resolved set
+    seeding: str = "random"
+    seed_nodes: Optional[Tuple[int, ...]] = None
+
 DEFAULT_NET_TOPOLOGIES = {
     "Erdos-Renyi": NetTopologyConfig(name="ER", nodes=1200, node_birth_probability=0.004, directed=False),
     "Watts-Strogatz": NetTopologyConfig(name="WS", nodes=1200, no_linked_nodes=12, stage_relink_probability=0.12),
@@ -37,3 +53,9 @@ DEFAULT_NET_TOPOLOGIES = {
     "Holme-Kim": NetTopologyConfig(name="HK", nodes=1200, no_linked_edges=3, tri_formation_probability=0.3)
 }
 
+# Real-world graphs, e.g. CASCADESIM_EDGE_LISTS=/data/follows.txt.gz:/data/retweets.txt
+EDGE_LIST_TOPOLOGIES = {
+    os.path.basename(path): NetTopologyConfig(name="EDGELIST", nodes=0, edge_list_path=path)
+    for path in os.environ.get("CASCADESIM_EDGE_LISTS", "").split(os.pathsep)
+    if path
+}
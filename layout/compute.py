@@ -1,7 +1,30 @@
+import random
 import networkx as nx
 from typing import Dict, Tuple
 from config import NetTopologyConfig
 
+# spring layout is quadratic-ish, loaded edge lists fall back to a random layout
+SPRING_LAYOUT_MAX_NODES = 20_000
+
 def compute_layout(graph: nx.Graph, seed: int = NetTopologyConfig.seed) -> Dict[int, Tuple[float, float]]:
+    if graph.number_of_nodes() > SPRING_LAYOUT_MAX_NODES:
+        return nx.random_layout(graph, seed=seed)
     return nx.spring_layout(graph, seed=seed, k=None, iterations=50)
- 
\ No newline at end of file
+
+# Place nodes added after the layout was computed (temporal networks) next to
+# their already placed neighbours instead of re-running the spring layout
+def extend_layout(
+        graph: nx.Graph, loc: Dict[int, Tuple[float, float]], seed: int = NetTopologyConfig.seed, jitter: float = 0.02
+) -> Dict[int, Tuple[float, float]]:
+    rng = random.Random(seed)
+    loc = dict(loc)
+
+    for node in sorted(n for n in graph.nodes() if n not in loc):
+        placed = [loc[neighbor] for neighbor in nx.all_neighbors(graph, node) if neighbor in loc]
+        if placed:
+            x = sum(p[0] for p in placed) / len(placed)
+            y = sum(p[1] for p in placed) / len(placed)
+        else:
+            x, y = rng.uniform(-1, 1), rng.uniform(-1, 1)
+        loc[node] = (x + rng.uniform(-jitter, jitter), y + rng.uniform(-jitter, jitter))
+    return loc
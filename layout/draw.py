@@ -81,8 +81,12 @@ def draw_node(
         name="nodes"
     )
 
-def update_colors_per_frame(graph: nx.Graph, iterations: List[dict]) -> Tuple[List[go.Frame], List[int]]:
-    nodes = list(graph.nodes())
+def update_colors_per_frame(
+        graph: nx.Graph, iterations: List[dict], nodes: Optional[List[int]] = None
+) -> Tuple[List[go.Frame], List[int]]:
+    # nodes overrides the graph's node order, e.g. to include nodes born later
+    if nodes is None:
+        nodes = list(graph.nodes())
     current_node_state = dict()
     colors = [0] * len(nodes)
 
@@ -1,244 +1,619 @@
 from __future__ import annotations
+import logging
 import os
 import math
-from dash import Dash, dcc, html, Input, Output, State
-
-from config import DEFAULT_NET_TOPOLOGIES, NetTopologyConfig, CascadeConfig
-from builders import dashboard_builders
-
-app = Dash(__name__)
-app.title = "CascadeSim — Information Diffusion Lab"
-
-app.layout = html.Div(
-    style={
-        "background": "radial-gradient(circle at top, #0f172a, #020617)",
-        "minHeight": "100vh",
-        "color": "#e5e7eb",
-        "fontFamily": "Inter, system-ui, sans-serif",
-        "padding": "16px",
-    },
-    children=[
-        html.H2("CascadeSim", style={"marginBottom": "4px"}),
-        html.Div("Information Diffusion Lab", style={"opacity": 0.7}),
-        html.Hr(),
-
-        html.Div(
-            style={"display": "flex", "gap": "16px", "flexWrap": "wrap"},
-            children=[
-                html.Div(
-                    style={
-                        "width": "320px",
-                        "background": "#020617",
-                        "padding": "16px",
-                        "borderRadius": "16px",
-                        "boxShadow": "0 10px 40px rgba(0,0,0,0.5)",
-                    },
-                    children=[
-                        html.H4("Network Topology"),
-
-                        dcc.Dropdown(
-                            id="topology",
-                            options=[{"label": k, "value": k} for k in DEFAULT_NET_TOPOLOGIES],
-                            value="Barbasi-Albert",
-                            clearable=False,
-                            style={
-                                "backgroundColor": "#e5e7eb",
-                                "color": "#020617",
-                            },
-                        ),
-
-                        html.Hr(),
-
-                        html.Label("Network Size (log)", style={"opacity": 0.85}),
-                        dcc.Slider(
-                            id="n_log",
-                            min=1,
-                            max=3,
-                            step=0.01,
-                            value=2,
-                            marks={1: "10", 2: "100", 3: "1000"},
-                        ),
-
-                        html.Label("Initial Broadcaster Fraction (log)", style={"opacity": 0.85}),
-                        dcc.Slider(
-                            id="seed_log",
-                            min=-3,
-                            max=-1,
-                            step=0.05,
-                            value=-2,
-                            marks={-3: "0.001", -2: "0.01", -1: "0.1"},
-                        ),
-
-                        html.Label("Influence Probability (log)", style={"opacity": 0.85}),
-                        dcc.Slider(
-                            id="influence_log",
-                            min=-3,
-                            max=-0.5,
-                            step=0.05,
-                            value=-1,
-                            marks={-3: "0.001", -2: "0.01", -1: "0.1"},
-                        ),
-
-                        html.Label("Iterations", style={"opacity": 0.85}),
-                        dcc.Slider(id="iters", min=20, max=200, step=10, value=60),
-
-                        html.Label("Monte Carlo Runs", style={"opacity": 0.85}),
-                        dcc.Slider(id="mc_runs", min=5, max=60, step=5, value=20),
-
-                        html.Br(),
-                        html.Button(
-                            "Run Simulation",
-                            id="recompute",
-                            n_clicks=0,
-                            style={
-                                "width": "100%",
-                                "background": "#2563eb",
-                                "border": "none",
-                                "padding": "10px",
-                                "borderRadius": "10px",
-                                "color": "white",
-                                "fontWeight": 600,
-                                "cursor": "pointer",
-                            },
-                        ),
-                    ],
-                ),
-
-                html.Div(
-                    style={"flex": 1},
-                    children=[
-                        dcc.Tabs(
-                            value="tab-cascade",
-                            colors={
-                                "border": "#020617",
-                                "primary": "#2563eb",
-                                "background": "#020617",
-                            },
-                            children=[
-                                dcc.Tab(
-                                    label="Animated Cascade",
-                                    value="tab-cascade",
-                                    style={
-                                        "backgroundColor": "#020617",
-                                        "color": "#9ca3af",
-                                        "padding": "10px",
-                                        "fontWeight": 500,
-                                    },
-                                    selected_style={
-                                        "backgroundColor": "#020617",
-                                        "color": "#e5e7eb",
-                                        "padding": "10px",
-                                        "fontWeight": 600,
-                                        "borderBottom": "2px solid #2563eb",
-                                    },
-                                    children=[
-                                        dcc.Graph(
-                                            id="cascade-fig",
-                                            config={"displayModeBar": False},
-                                            style={"height": "82vh"},
-                                        )
-                                    ],
-                                ),
-                                dcc.Tab(
-                                    label="Analysis & Metrics",
-                                    value="tab-analysis",
-                                    style={
-                                        "backgroundColor": "#020617",
-                                        "color": "#9ca3af",
-                                        "padding": "10px",
-                                        "fontWeight": 500,
-                                    },
-                                    selected_style={
-                                        "backgroundColor": "#020617",
-                                        "color": "#e5e7eb",
-                                        "padding": "10px",
-                                        "fontWeight": 600,
-                                        "borderBottom": "2px solid #2563eb",
-                                    },
-                                    children=[
-                                        html.Div(
-                                            style={
-                                                "display": "grid",
-                                                "gridTemplateColumns": "repeat(auto-fit, minmax(320px, 1fr))",
-                                                "gap": "12px",
-                                                "marginTop": "12px",
-                                            },
-                                            children=[
-                                                dcc.Graph(id="dynamics-fig", config={"displayModeBar": False}),
-                                                dcc.Graph(id="degree-fig", config={"displayModeBar": False}),
-                                                dcc.Graph(id="mc-fig", config={"displayModeBar": False}),
-                                            ],
-                                        ),
-                                        html.Div(
-                                            style={
-                                                "marginTop": "16px",
-                                                "background": "#020617",
-                                                "padding": "16px",
-                                                "borderRadius": "16px",
-                                            },
-                                            children=[
-                                                html.H4("Topology Summary"),
-                                                html.Div(id="metrics-table"),
-                                            ],
-                                        ),
-                                    ],
-                                ),
-                            ],
-                        )
-                    ],
-                ),
-            ],
-        ),
-    ],
-)
-
-@app.callback(
-    Output("cascade-fig", "figure"),
-    Output("dynamics-fig", "figure"),
-    Output("degree-fig", "figure"),
-    Output("mc-fig", "figure"),
-    Output("metrics-table", "children"),
-    Input("recompute", "n_clicks"),
-    State("topology", "value"),
-    State("n_log", "value"),
-    State("seed_log", "value"),
-    State("influence_log", "value"),
-    State("iters", "value"),
-    State("mc_runs", "value"),
-)
-def update_fig(_, topology_label, n_log, seed_log, influence_log, iters, mc_runs):
-
-    n = int(round(10 ** n_log))
-    seed_frac = 10 ** seed_log
-    influence = 10 ** influence_log
-
-    base = DEFAULT_NET_TOPOLOGIES[topology_label]
-    topo_cfg = NetTopologyConfig(**{**base.__dict__, "nodes": n})
+import threading
+from typing import Tuple
+from dash import Dash, dcc, html, Input, Output, State, no_update
+
+from config import DEFAULT_NET_TOPOLOGIES, EDGE_LIST_TOPOLOGIES, NetTopologyConfig, CascadeConfig
+
+logger = logging.getLogger(__name__)
+
+# builders pull in networkx / numpy / pandas / plotly.graph_objects, so they
+# are only imported inside the callbacks (or by the background warm-up)
+
+# frames shipped with the first response; the rest is paged in while playing
+PLAYBACK_INITIAL_FRAMES = 10
+PLAYBACK_CHUNK_FRAMES = 20
+
+# the next chunk is requested once playback is this close to the last loaded frame
+PLAYBACK_PREFETCH_FRAMES = 5
+
+# synthetic topologies plus any edge lists configured via CASCADESIM_EDGE_LISTS
+ALL_NET_TOPOLOGIES = {**DEFAULT_NET_TOPOLOGIES, **EDGE_LIST_TOPOLOGIES}
+
+# initial control values, shared by the layout and the warm-up
+DEFAULT_CONTROLS = {
+    "topology": "Barbasi-Albert",
+    "n_log": 2,
+    "seed_log": -2,
+    "influence_log": -1,
+    "iters": 60,
+    "mc_runs": 20,
+    "evolution": "static",
+    "seeding": "random",
+}
+
+SEEDING_OPTIONS = [
+    {"label": "Random", "value": "random"},
+    {"label": "Top degree", "value": "degree"},
+    # CELF_MAX_SEEDS in cascades.seed_selection, not imported here to keep startup light
+    {"label": "CELF lazy greedy (Monte Carlo, slow; first 10 seeds, rest by degree)", "value": "celf"},
+    {"label": "Reverse-reachable sampling", "value": "rr"},
+]
+
+EVOLUTION_OPTIONS = [
+    {"label": "Static network", "value": "static"},
+    {"label": "Growth (preferential attachment)", "value": "growth"},
+    {"label": "Rewiring (small-world)", "value": "rewire"},
+]
+
+def configs_from_controls(
+    topology_label: str,
+    n_log: float,
+    seed_log: float,
+    influence_log: float,
+    iters: int,
+    evolution: str = DEFAULT_CONTROLS["evolution"],
+    seeding: str = DEFAULT_CONTROLS["seeding"],
+) -> Tuple[NetTopologyConfig, CascadeConfig]:
+    base = ALL_NET_TOPOLOGIES[topology_label]
+
+    # loaded edge lists have a fixed size, the slider only applies to synthetic graphs
+    nodes = base.nodes if base.name == "EDGELIST" else int(round(10 ** n_log))
+    topo_cfg = NetTopologyConfig(**{**base.__dict__, "nodes": nodes, "evolution": evolution})
 
     cas_cfg = CascadeConfig(
-        fraction_infected=seed_frac,
-        influence_probability=influence,
+        fraction_infected=10 ** seed_log,
+        influence_probability=10 ** influence_log,
         iterations=int(iters),
         seed=42,
+        seeding=seeding,
     )
+    return topo_cfg, cas_cfg
+
+def build_layout() -> html.Div:
+    return html.Div(
+        style={
+            "background": "radial-gradient(circle at top, #0f172a, #020617)",
+            "minHeight": "100vh",
+            "color": "#e5e7eb",
+            "fontFamily": "Inter, system-ui, sans-serif",
+            "padding": "16px",
+        },
+        children=[
+            html.H2("CascadeSim", style={"marginBottom": "4px"}),
+            html.Div("Information Diffusion Lab", style={"opacity": 0.7}),
+            html.Hr(),
+
+            dcc.Store(id="playback"),
+            dcc.Store(id="frame-request"),
+            dcc.Store(id="frame-chunk"),
+            dcc.Store(id="frame-sink"),
+            dcc.Interval(id="frame-pager", interval=250, disabled=True),
+
+            html.Div(
+                style={"display": "flex", "gap": "16px", "flexWrap": "wrap"},
+                children=[
+                    html.Div(
+                        style={
+                            "width": "320px",
+                            "background": "#020617",
+                            "padding": "16px",
+                            "borderRadius": "16px",
+                            "boxShadow": "0 10px 40px rgba(0,0,0,0.5)",
+                        },
+                        children=[
+                            html.H4("Network Topology"),
+
+                            dcc.Dropdown(
+                                id="topology",
+                                options=[{"label": k, "value": k} for k in ALL_NET_TOPOLOGIES],
+                                value=DEFAULT_CONTROLS["topology"],
+                                clearable=False,
+                                style={
+                                    "backgroundColor": "#e5e7eb",
+                                    "color": "#020617",
+                                },
+                            ),
+
+                            html.Label("Network Evolution", style={"opacity": 0.85}),
+                            dcc.Dropdown(
+                                id="evolution",
+                                options=EVOLUTION_OPTIONS,
+                                value=DEFAULT_CONTROLS["evolution"],
+                                clearable=False,
+                                style={
+                                    "backgroundColor": "#e5e7eb",
+                                    "color": "#020617",
+                                },
+                            ),
+
+                            html.Label("Seeding Strategy", style={"opacity": 0.85}),
+                            dcc.Dropdown(
+                                id="seeding",
+                                options=SEEDING_OPTIONS,
+                                value=DEFAULT_CONTROLS["seeding"],
+                                clearable=False,
+                                style={
+                                    "backgroundColor": "#e5e7eb",
+                                    "color": "#020617",
+                                },
+                            ),
+
+                            html.Hr(),
+
+                            html.Label("Network Size (log)", style={"opacity": 0.85}),
+                            dcc.Slider(
+                                id="n_log",
+                                min=1,
+                                max=3,
+                                step=0.01,
+                                value=DEFAULT_CONTROLS["n_log"],
+                                marks={1: "10", 2: "100", 3: "1000"},
+                            ),
 
-    cascade_fig, dynamics_fig, degree_fig, mc_fig, metrics = dashboard_builders.build_dashboard(
-        topology_label, topo_cfg, cas_cfg, runs=int(mc_runs)
+                            html.Label("Initial Broadcaster Fraction (log)", style={"opacity": 0.85}),
+                            dcc.Slider(
+                                id="seed_log",
+                                min=-3,
+                                max=-1,
+                                step=0.05,
+                                value=DEFAULT_CONTROLS["seed_log"],
+                                marks={-3: "0.001", -2: "0.01", -1: "0.1"},
+                            ),
+
+                            html.Label("Influence Probability (log)", style={"opacity": 0.85}),
+                            dcc.Slider(
+                                id="influence_log",
+                                min=-3,
+                                max=-0.5,
+                                step=0.05,
+                                value=DEFAULT_CONTROLS["influence_log"],
+                                marks={-3: "0.001", -2: "0.01", -1: "0.1"},
+                            ),
+
+                            html.Label("Iterations", style={"opacity": 0.85}),
+                            dcc.Slider(id="iters", min=20, max=200, step=10, value=DEFAULT_CONTROLS["iters"]),
+
+                            html.Label("Monte Carlo Runs", style={"opacity": 0.85}),
+                            dcc.Slider(id="mc_runs", min=5, max=60, step=5, value=DEFAULT_CONTROLS["mc_runs"]),
+
+                            html.Br(),
+                            html.Button(
+                                "Run Simulation",
+                                id="recompute",
+                                n_clicks=0,
+                                style={
+                                    "width": "100%",
+                                    "background": "#2563eb",
+                                    "border": "none",
+                                    "padding": "10px",
+                                    "borderRadius": "10px",
+                                    "color": "white",
+                                    "fontWeight": 600,
+                                    "cursor": "pointer",
+                                },
+                            ),
+                            html.Button(
+                                "Compare All Topologies",
+                                id="compare",
+                                n_clicks=0,
+                                style={
+                                    "width": "100%",
+                                    "marginTop": "8px",
+                                    "background": "#0f172a",
+                                    "border": "1px solid #2563eb",
+                                    "padding": "10px",
+                                    "borderRadius": "10px",
+                                    "color": "white",
+                                    "fontWeight": 600,
+                                    "cursor": "pointer",
+                                },
+                            ),
+                            html.Div(
+                                id="preview-status",
+                                style={"marginTop": "12px", "opacity": 0.85, "fontSize": "0.9em"},
+                            ),
+                        ],
+                    ),
+
+                    html.Div(
+                        style={"flex": 1},
+                        children=[
+                            dcc.Tabs(
+                                value="tab-cascade",
+                                colors={
+                                    "border": "#020617",
+                                    "primary": "#2563eb",
+                                    "background": "#020617",
+                                },
+                                children=[
+                                    dcc.Tab(
+                                        label="Animated Cascade",
+                                        value="tab-cascade",
+                                        style={
+                                            "backgroundColor": "#020617",
+                                            "color": "#9ca3af",
+                                            "padding": "10px",
+                                            "fontWeight": 500,
+                                        },
+                                        selected_style={
+                                            "backgroundColor": "#020617",
+                                            "color": "#e5e7eb",
+                                            "padding": "10px",
+                                            "fontWeight": 600,
+                                            "borderBottom": "2px solid #2563eb",
+                                        },
+                                        children=[
+                                            dcc.Graph(
+                                                id="cascade-fig",
+                                                config={"displayModeBar": False},
+                                                style={"height": "82vh"},
+                                            )
+                                        ],
+                                    ),
+                                    dcc.Tab(
+                                        label="Analysis & Metrics",
+                                        value="tab-analysis",
+                                        style={
+                                            "backgroundColor": "#020617",
+                                            "color": "#9ca3af",
+                                            "padding": "10px",
+                                            "fontWeight": 500,
+                                        },
+                                        selected_style={
+                                            "backgroundColor": "#020617",
+                                            "color": "#e5e7eb",
+                                            "padding": "10px",
+                                            "fontWeight": 600,
+                                            "borderBottom": "2px solid #2563eb",
+                                        },
+                                        children=[
+                                            html.Div(
+                                                style={
+                                                    "display": "grid",
+                                                    "gridTemplateColumns": "repeat(auto-fit, minmax(320px, 1fr))",
+                                                    "gap": "12px",
+                                                    "marginTop": "12px",
+                                                },
+                                                children=[
+                                                    dcc.Graph(id="dynamics-fig", config={"displayModeBar": False}),
+                                                    dcc.Graph(id="degree-fig", config={"displayModeBar": False}),
+                                                    dcc.Graph(id="mc-fig", config={"displayModeBar": False}),
+                                                    dcc.Graph(id="expected-fig", config={"displayModeBar": False}),
+                                                    dcc.Graph(id="sweep-fig", config={"displayModeBar": False}),
+                                                    dcc.Graph(id="seeding-fig", config={"displayModeBar": False}),
+                                                ],
+                                            ),
+                                            html.Div(
+                                                style={
+                                                    "marginTop": "16px",
+                                                    "background": "#020617",
+                                                    "padding": "16px",
+                                                    "borderRadius": "16px",
+                                                },
+                                                children=[
+                                                    html.H4("Topology Summary"),
+                                                    html.Div(id="metrics-table"),
+                                                ],
+                                            ),
+                                        ],
+                                    ),
+                                    dcc.Tab(
+                                        label="Topology Comparison",
+                                        value="tab-compare",
+                                        style={
+                                            "backgroundColor": "#020617",
+                                            "color": "#9ca3af",
+                                            "padding": "10px",
+                                            "fontWeight": 500,
+                                        },
+                                        selected_style={
+                                            "backgroundColor": "#020617",
+                                            "color": "#e5e7eb",
+                                            "padding": "10px",
+                                            "fontWeight": 600,
+                                            "borderBottom": "2px solid #2563eb",
+                                        },
+                                        children=[
+                                            html.Div(
+                                                style={
+                                                    "display": "grid",
+                                                    "gridTemplateColumns": "repeat(auto-fit, minmax(320px, 1fr))",
+                                                    "gap": "12px",
+                                                    "marginTop": "12px",
+                                                },
+                                                children=[
+                                                    dcc.Graph(id="compare-dynamics-fig", config={"displayModeBar": False}),
+                                                    dcc.Graph(id="compare-mc-fig", config={"displayModeBar": False}),
+                                                ],
+                                            ),
+                                        ],
+                                    ),
+                                ],
+                            )
+                        ],
+                    ),
+                ],
+            ),
+        ],
     )
 
-    rows = []
-    for k, v in metrics.items():
-        sval = "n/a" if isinstance(v, float) and not math.isfinite(v) else f"{v:.4g}"
-        rows.append(html.Tr([html.Td(k), html.Td(sval)]))
+def register_callbacks(app: Dash) -> None:
+    # the cascade view and the analysis panels are separate callbacks, so the
+    # first frame does not wait for the Monte Carlo / sweep work
+    @app.callback(
+        Output("cascade-fig", "figure"),
+        Output("playback", "data"),
+        Output("frame-pager", "disabled"),
+        Input("recompute", "n_clicks"),
+        State("topology", "value"),
+        State("n_log", "value"),
+        State("seed_log", "value"),
+        State("influence_log", "value"),
+        State("iters", "value"),
+        State("evolution", "value"),
+        State("seeding", "value"),
+    )
+    def update_cascade(_, topology_label, n_log, seed_log, influence_log, iters, evolution, seeding):
+        from builders import dashboard_builders
+
+        topo_cfg, cas_cfg = configs_from_controls(
+            topology_label, n_log, seed_log, influence_log, iters, evolution, seeding
+        )
+
+        cascade_fig = dashboard_builders.cached_build_cascade_view(
+            topology_label, topo_cfg, cas_cfg, initial_frames=PLAYBACK_INITIAL_FRAMES
+        )
+
+        playback = cascade_fig.layout.meta
+        paging_done = playback["loaded_frames"] >= playback["total_frames"]
 
-    table = html.Table(
-        [html.Thead(html.Tr([html.Th("Metric"), html.Th("Value")]))]
-        + [html.Tbody(rows)],
-        style={"width": "100%", "borderCollapse": "collapse"},
+        return cascade_fig, playback, paging_done
+
+
+    @app.callback(
+        Output("dynamics-fig", "figure"),
+        Output("degree-fig", "figure"),
+        Output("mc-fig", "figure"),
+        Output("sweep-fig", "figure"),
+        Output("seeding-fig", "figure"),
+        Output("metrics-table", "children"),
+        Input("recompute", "n_clicks"),
+        State("topology", "value"),
+        State("n_log", "value"),
+        State("seed_log", "value"),
+        State("influence_log", "value"),
+        State("iters", "value"),
+        State("mc_runs", "value"),
+        State("evolution", "value"),
+        State("seeding", "value"),
     )
+    def update_analysis(_, topology_label, n_log, seed_log, influence_log, iters, mc_runs, evolution, seeding):
+        from builders import dashboard_builders
+
+        topo_cfg, cas_cfg = configs_from_controls(
+            topology_label, n_log, seed_log, influence_log, iters, evolution, seeding
+        )
+
+        dynamics_fig, degree_fig, mc_fig, sweep_fig, seeding_fig, metrics = dashboard_builders.cached_build_analysis(
+            topology_label, topo_cfg, cas_cfg, runs=int(mc_runs)
+        )
+
+        rows = []
+        for k, v in metrics.items():
+            sval = "n/a" if isinstance(v, float) and not math.isfinite(v) else f"{v:.4g}"
+            rows.append(html.Tr([html.Td(k), html.Td(sval)]))
+
+        table = html.Table(
+            [html.Thead(html.Tr([html.Th("Metric"), html.Th("Value")]))]
+            + [html.Tbody(rows)],
+            style={"width": "100%", "borderCollapse": "collapse"},
+        )
+
+        return dynamics_fig, degree_fig, mc_fig, sweep_fig, seeding_fig, table
+
+
+    # runs in the browser on every pager tick; only asks the server for the next
+    # chunk once the playing frame gets within PLAYBACK_PREFETCH_FRAMES of the
+    # last loaded one
+    app.clientside_callback(
+        """
+        function(_, playback, sink, pending) {
+            var no_update = window.dash_clientside.no_update;
+            if (!playback || !playback.playback_token) {
+                return [no_update, true];
+            }
+            var token = playback.playback_token;
+            var gd = document.querySelector("#cascade-fig .js-plotly-plot");
+            if (!gd || !gd.on) {
+                return [no_update, false];
+            }
+
+            if (!gd._cascadesimListening) {
+                gd._cascadesimListening = true;
+                gd.on("plotly_animatingframe", function(event) {
+                    gd._cascadesimFrame = Number(event.name) || 0;
+                });
+            }
+            if (gd._cascadesimToken !== token) {
+                gd._cascadesimToken = token;
+                gd._cascadesimFrame = 0;
+            }
+
+            var loaded = (sink && sink.token === token) ? sink.stop : playback.loaded_frames;
+            if (loaded >= playback.total_frames) {
+                return [no_update, true];
+            }
+            // already asked for this chunk (an evicted history answers with no frames)
+            if (pending && pending.token === token && pending.start === loaded) {
+                return [no_update, false];
+            }
+            if (gd._cascadesimFrame + %d < loaded) {
+                return [no_update, false];
+            }
+            return [{token: token, start: loaded}, false];
+        }
+        """ % PLAYBACK_PREFETCH_FRAMES,
+        Output("frame-request", "data"),
+        Output("frame-pager", "disabled", allow_duplicate=True),
+        Input("frame-pager", "n_intervals"),
+        State("playback", "data"),
+        State("frame-sink", "data"),
+        State("frame-request", "data"),
+        prevent_initial_call=True,
+    )
+
+
+    @app.callback(
+        Output("frame-chunk", "data"),
+        Input("frame-request", "data"),
+        prevent_initial_call=True,
+    )
+    def page_frames(request):
+        from builders import playback_builders
+
+        if not request:
+            return no_update
+
+        frames = playback_builders.playback_chunk(request["token"], request["start"], PLAYBACK_CHUNK_FRAMES)
+        return {"token": request["token"], "stop": request["start"] + len(frames), "frames": frames}
+
+
+    app.clientside_callback(
+        """
+        function(chunk) {
+            if (!chunk || !chunk.frames || chunk.frames.length === 0) {
+                return window.dash_clientside.no_update;
+            }
+            var gd = document.querySelector("#cascade-fig .js-plotly-plot");
+            if (!gd || !gd.layout || !gd.layout.meta || gd.layout.meta.playback_token !== chunk.token) {
+                return window.dash_clientside.no_update;
+            }
+            Plotly.addFrames(gd, chunk.frames);
+
+            // a running animation only knows the frames it started with,
+            // so queue the freshly paged ones behind it
+            var queue = gd._transitionData && gd._transitionData._frameQueue;
+            if (queue && queue.length > 0) {
+                Plotly.animate(gd, chunk.frames.map(function(f) { return f.name; }), {
+                    mode: "afterall",
+                    frame: {duration: 280},
+                });
+            }
+            return {token: chunk.token, stop: chunk.stop};
+        }
+        """,
+        Output("frame-sink", "data"),
+        Input("frame-chunk", "data"),
+    )
+
+
+    # runs alongside update_analysis; the mean-field preview returns well before the
+    # Monte Carlo results do
+    @app.callback(
+        Output("expected-fig", "figure"),
+        Output("preview-status", "children"),
+        Input("recompute", "n_clicks"),
+        State("topology", "value"),
+        State("n_log", "value"),
+        State("seed_log", "value"),
+        State("influence_log", "value"),
+        State("iters", "value"),
+        State("evolution", "value"),
+        State("seeding", "value"),
+    )
+    def update_preview(_, topology_label, n_log, seed_log, influence_log, iters, evolution, seeding):
+        from builders import dashboard_builders
+
+        topo_cfg, cas_cfg = configs_from_controls(
+            topology_label, n_log, seed_log, influence_log, iters, evolution, seeding
+        )
+
+        expected_fig, expected_size = dashboard_builders.build_expected_preview(
+            topology_label, topo_cfg, cas_cfg
+        )
+
+        # the mean-field model ignores evolution, say so rather than imply otherwise
+        model = "mean-field" if evolution == "static" else "mean-field, static network"
+        return expected_fig, f"Expected cascade size ({model}): {expected_size:.4g} responses / node"
+
+
+    @app.callback(
+        Output("compare-dynamics-fig", "figure"),
+        Output("compare-mc-fig", "figure"),
+        Input("compare", "n_clicks"),
+        State("n_log", "value"),
+        State("seed_log", "value"),
+        State("influence_log", "value"),
+        State("iters", "value"),
+        State("mc_runs", "value"),
+        prevent_initial_call=True,
+    )
+    def update_comparison(_, n_log, seed_log, influence_log, iters, mc_runs):
+        from builders import dashboard_builders
+
+        topo_cfgs = {}
+        for label in DEFAULT_NET_TOPOLOGIES:
+            topo_cfgs[label], cas_cfg = configs_from_controls(label, n_log, seed_log, influence_log, iters)
+
+        return dashboard_builders.build_comparison(topo_cfgs, cas_cfg, runs=int(mc_runs))
+
+
+def warm_up() -> None:
+    """
+    Import the heavy modules and pre-build the default view into the shared
+    result cache, so the first real "Run Simulation" is a cache hit. Runs in
+    a background thread and does not depend on the server's bind address.
+    """
+    try:
+        _warm_default_view()
+    except Exception:
+        logger.exception("Warm-up of the default view failed")
+
+
+def _warm_default_view() -> None:
+    from builders import dashboard_builders
+
+    topo_cfg, cas_cfg = configs_from_controls(
+        DEFAULT_CONTROLS["topology"],
+        DEFAULT_CONTROLS["n_log"],
+        DEFAULT_CONTROLS["seed_log"],
+        DEFAULT_CONTROLS["influence_log"],
+        DEFAULT_CONTROLS["iters"],
+    )
+    dashboard_builders.cached_build_cascade_view(
+        DEFAULT_CONTROLS["topology"], topo_cfg, cas_cfg, initial_frames=PLAYBACK_INITIAL_FRAMES
+    )
+    dashboard_builders.cached_build_analysis(
+        DEFAULT_CONTROLS["topology"], topo_cfg, cas_cfg, runs=DEFAULT_CONTROLS["mc_runs"]
+    )
+
+
+def create_app(warm: bool | None = None) -> Dash:
+    """
+    App factory. Only Dash and the config dataclasses are imported here;
+    set CASCADESIM_WARM_UP=0 to skip the background warm-up.
+    """
+    app = Dash(__name__)
+    app.title = "CascadeSim — Information Diffusion Lab"
+    app.layout = build_layout()
+    register_callbacks(app)
+
+    if warm is None:
+        warm = os.environ.get("CASCADESIM_WARM_UP", "1") != "0"
+    if warm:
+        threading.Thread(target=warm_up, daemon=True).start()
+
+    return app
+
 
-    return cascade_fig, dynamics_fig, degree_fig, mc_fig, table
+def create_server(warm: bool | None = None):
+    # WSGI entry point, e.g. gunicorn "main:create_server()"
+    return create_app(warm).server
 
 
 if __name__ == "__main__":
-    app.run(debug=False, host="0.0.0.0", port=int(os.environ.get("PORT", 8050)))
\ No newline at end of file
+    create_app().run(debug=False, host="0.0.0.0", port=int(os.environ.get("PORT", 8050)))
\ No newline at end of file